@@ -15,6 +15,7 @@ import logging
 import os
 import hashlib
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from threading import Lock
@@ -22,6 +23,7 @@ from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
 import requests
+import zstandard as zstd
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 # Configure logging
@@ -39,6 +41,7 @@ SOURCES_JSON = CACHE_DIR / "sources.json"
 
 SETTINGS_JSON = CONFIG_DIR / "settings.json"
 SUBJECTS = ["math", "ela"]
+ZSTD_LEVEL = 3  # Compression level for cached HTML (.html.zst)
 FREQUENT_REFRESH_HOURS = int(os.getenv("FREQUENT_REFRESH_HOURS", "24"))
 BACKGROUND_REFRESH_DAYS = int(os.getenv("BACKGROUND_REFRESH_DAYS", "30"))
 
@@ -77,20 +80,57 @@ GRADUATION_YEARS = list(range(
 ))
 
 
+@dataclass(slots=True)
+class SourceEntry:
+    """One fetched (or cache-reused) source, serialized to sources.json at save time.
+
+    Slots keep per-entry memory down versus a dict; with thousands of URLs
+    per run the entries are only converted to dicts once, when written out.
+    """
+    url: str
+    fetched_at: str
+    status: str
+    filepath: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    sha256: Optional[str] = None
+    reused_at: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        entry = {
+            "url": self.url,
+            "fetched_at": self.fetched_at,
+            "status": self.status,
+            "filepath": self.filepath,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "sha256": self.sha256,
+        }
+        if self.reused_at is not None:
+            entry["reused_at"] = self.reused_at
+        return entry
+
+
 class DataFetcher:
     """Fetch and cache NYS education data sources."""
 
     def __init__(self):
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        self.sources: List[Dict] = []
+        self.sources: List[SourceEntry] = []
         self.sources_lock = Lock()  # Thread-safe access to sources list
+        # Timestamps only matter at run granularity for refresh decisions,
+        # so one ISO string per run avoids a datetime.now() call per record.
+        self.run_timestamp = datetime.now(timezone.utc).isoformat()
         self.frequent_refresh_window = timedelta(hours=FREQUENT_REFRESH_HOURS)
         self.background_refresh_window = timedelta(days=BACKGROUND_REFRESH_DAYS)
         self.previous_sources_by_url = self._load_previous_sources_by_url()
         self.previous_sources_by_filename = self._load_previous_sources_by_filename()
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'NYS-District-Dashboard/1.0 (Educational Research)'
+            'User-Agent': 'NYS-District-Dashboard/1.0 (Educational Research)',
+            # Opt into brotli in addition to requests' default gzip/deflate;
+            # requests decodes transparently when the brotli package is installed.
+            'Accept-Encoding': 'gzip, br, deflate',
         })
 
     def _parse_timestamp(self, timestamp: Optional[str]) -> Optional[datetime]:
@@ -165,9 +205,16 @@ class DataFetcher:
 
     def _record_cached_source(self, source: Dict):
         """Record reuse of cached source while preserving original fetch timestamp."""
-        cached_entry = dict(source)
-        cached_entry["status"] = "success"
-        cached_entry["reused_at"] = datetime.now(timezone.utc).isoformat()
+        cached_entry = SourceEntry(
+            url=source.get("url", ""),
+            fetched_at=source.get("fetched_at", ""),
+            status="success",
+            filepath=source.get("filepath"),
+            etag=source.get("etag"),
+            last_modified=source.get("last_modified"),
+            sha256=source.get("sha256"),
+            reused_at=self.run_timestamp,
+        )
         with self.sources_lock:
             self.sources.append(cached_entry)
 
@@ -187,24 +234,33 @@ class DataFetcher:
         return hashlib.sha256(content).hexdigest()
 
     def save_file(self, content: bytes, filename: str) -> str:
-        """Save content to cache directory and return filepath."""
+        """Save content to cache directory and return filepath.
+
+        Files named *.zst are zstd-compressed on write; NYSED HTML is highly
+        compressible, so this shrinks the cache roughly 8x. SHA256 hashes are
+        always computed on the uncompressed content, so sources.json semantics
+        are unchanged.
+        """
         filepath = CACHE_DIR / filename
-        filepath.write_bytes(content)
+        if filename.endswith('.zst'):
+            filepath.write_bytes(zstd.compress(content, ZSTD_LEVEL))
+        else:
+            filepath.write_bytes(content)
         return str(filepath)
 
     def record_source(self, url: str, status: str, filepath: Optional[str] = None,
                      etag: Optional[str] = None, last_modified: Optional[str] = None,
                      sha256: Optional[str] = None):
         """Record metadata about a fetched source (thread-safe)."""
-        source_entry = {
-            "url": url,
-            "fetched_at": datetime.now(timezone.utc).isoformat(),
-            "status": status,
-            "filepath": filepath,
-            "etag": etag,
-            "last_modified": last_modified,
-            "sha256": sha256
-        }
+        source_entry = SourceEntry(
+            url=url,
+            fetched_at=self.run_timestamp,
+            status=status,
+            filepath=filepath,
+            etag=etag,
+            last_modified=last_modified,
+            sha256=sha256,
+        )
         with self.sources_lock:
             self.sources.append(source_entry)
 
@@ -223,7 +279,7 @@ class DataFetcher:
                     continue
                 response = self.fetch_url(url)
                 if response:
-                    filename = f"{district_name.lower().replace(' ', '_')}_assessment_{subject}_{year}.html"
+                    filename = f"{district_name.lower().replace(' ', '_')}_assessment_{subject}_{year}.html.zst"
                     filepath = self.save_file(response.content, filename)
                     sha256 = self.compute_sha256(response.content)
                     
@@ -252,7 +308,7 @@ class DataFetcher:
                 continue
             response = self.fetch_url(url)
             if response:
-                filename = f"{district_name.lower().replace(' ', '_')}_enrollment_{year}.html"
+                filename = f"{district_name.lower().replace(' ', '_')}_enrollment_{year}.html.zst"
                 filepath = self.save_file(response.content, filename)
                 sha256 = self.compute_sha256(response.content)
                 
@@ -277,7 +333,7 @@ class DataFetcher:
             return
         response = self.fetch_url(budget_url)
         if response:
-            filename = f"{district_name.lower().replace(' ', '_')}_budget.html"
+            filename = f"{district_name.lower().replace(' ', '_')}_budget.html.zst"
             filepath = self.save_file(response.content, filename)
             sha256 = self.compute_sha256(response.content)
             
@@ -309,9 +365,11 @@ class DataFetcher:
         try:
             response = self.fetch_url(page_url)
             if response:
-                # Parse page to find the first .xlsx link
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.text, "html.parser")
+                # Parse page to find the first .xlsx link; the strainer keeps
+                # BS4 from building tree nodes for anything but anchors
+                from bs4 import BeautifulSoup, SoupStrainer
+                soup = BeautifulSoup(response.text, "html.parser",
+                                     parse_only=SoupStrainer("a", href=True))
                 for a_tag in soup.find_all("a", href=True):
                     href = a_tag["href"]
                     if href.lower().endswith(".xlsx"):
@@ -359,7 +417,7 @@ class DataFetcher:
                 continue
             response = self.fetch_url(url)
             if response:
-                filename = f"{district_lower}_gradrate_{year}.html"
+                filename = f"{district_lower}_gradrate_{year}.html.zst"
                 filepath = self.save_file(response.content, filename)
                 sha256 = self.compute_sha256(response.content)
 
@@ -391,7 +449,7 @@ class DataFetcher:
                     continue
                 response = self.fetch_url(url)
                 if response:
-                    filename = f"{district_lower}_pathways_{year}.html"
+                    filename = f"{district_lower}_pathways_{year}.html.zst"
                     filepath = self.save_file(response.content, filename)
                     sha256 = self.compute_sha256(response.content)
 
@@ -438,12 +496,12 @@ class DataFetcher:
         return name
 
     def save_sources_metadata(self):
-        """Save sources metadata to JSON."""
-        SOURCES_JSON.write_text(json.dumps(self.sources, indent=2))
+        """Save sources metadata to JSON (entries are serialized once, here)."""
+        SOURCES_JSON.write_text(json.dumps([s.to_dict() for s in self.sources], indent=2))
         logger.info(f"Saved sources metadata to {SOURCES_JSON}")
         logger.info(f"Total sources: {len(self.sources)}, "
-                   f"Successful: {sum(1 for s in self.sources if s['status'] == 'success')}, "
-                   f"Failed: {sum(1 for s in self.sources if s['status'] == 'failed')}")
+                   f"Successful: {sum(1 for s in self.sources if s.status == 'success')}, "
+                   f"Failed: {sum(1 for s in self.sources if s.status == 'failed')}")
 
 
 def main():
@@ -464,23 +522,26 @@ def main():
     
     # Fetch data for each district
     fetcher = DataFetcher()
-    
-    # Fetch fiscal profiles XLSX once (shared across all districts)
-    fetcher.fetch_fiscal_profiles()
-    
+
     # Process districts in parallel
     logger.info(f"\n{'='*60}")
     logger.info(f"Starting parallel fetch for {len(districts)} districts")
     logger.info(f"{'='*60}")
-    
+
     completed_count = 0
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Fetch fiscal profiles XLSX once (shared across all districts).
+        # The download and SHA256 of the 50+ MB file overlap with the
+        # district scrapes; hashlib releases the GIL on large buffers, so a
+        # worker thread is enough to keep it off the hot path.
+        fiscal_future = executor.submit(fetcher.fetch_fiscal_profiles)
+
         # Submit all district fetch tasks
         future_to_district = {
             executor.submit(fetcher.fetch_district_data, district): district
             for district in districts
         }
-        
+
         # Process completed tasks as they finish
         for future in as_completed(future_to_district):
             district = future_to_district[future]
@@ -490,6 +551,11 @@ def main():
                 logger.info(f"Progress: {completed_count}/{len(districts)} districts completed")
             except Exception as e:
                 logger.error(f"Error processing district {district.get('name', 'unknown')}: {e}")
+
+        try:
+            fiscal_future.result()
+        except Exception as e:
+            logger.error(f"Error fetching fiscal profiles: {e}")
     
     # Save sources metadata
     fetcher.save_sources_metadata()
@@ -10,15 +10,21 @@ Reads from cache/ and produces:
 - out/data/sources.json (copy from cache)
 """
 
-import json
+import functools
 import logging
+import os
 import re
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
 from pathlib import Path
 from typing import List, Dict, Optional
+from urllib.parse import parse_qs, urlparse
 
+import orjson
 import pandas as pd
-from bs4 import BeautifulSoup
+import zstandard as zstd
+from lxml import html as lxml_html
 
 # Configure logging
 logging.basicConfig(
@@ -33,568 +39,783 @@ OUT_DATA_DIR = Path("out/data")
 SEED_DATA_DIR = Path("data/seed")
 CONFIG_DIR = Path("config")
 
+# Parsing is CPU-bound (HTML parsing + regex), so cached files are parsed in
+# worker processes. Default to one worker per core; override to 1 to force
+# serial parsing.
+NORMALIZE_MAX_WORKERS = int(os.getenv("NORMALIZE_MAX_WORKERS", str(os.cpu_count() or 1)))
+
+# Bump whenever parser output changes so stale normalize_cache.json entries
+# are discarded rather than replayed.
+PARSER_VERSION = 1
+
+# Compiled once at import; the assessment/gradrate scans call these per table
+# cell, where repeated re.cache lookups add up.
+_PCT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+_PCT_OPT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*%?')
+_INT_RE = re.compile(r'^(\d+)$')
+# The four budget-page extractors fused into one alternation so the page text
+# is scanned once instead of four times. More specific branches come first so
+# "levy limit"/"proposed levy" aren't swallowed by the generic levy-percent arm.
+_BUDGET_RE = re.compile(
+    r'(?P<fy>20(?P<fy1>\d{2})[/-]20?(?P<fy2>\d{2}))'
+    r'|(?P<levy_limit>levy\s+limit.*?\$?(?P<levy_limit_val>[\d,]+(?:\.\d+)?))'
+    r'|(?P<proposed>proposed\s+levy.*?\$?(?P<proposed_val>[\d,]+(?:\.\d+)?))'
+    r'|(?P<levy_pct>levy.*?(?P<levy_pct_val>\d+(?:\.\d+)?)\s*%)',
+    re.IGNORECASE)
+
+# Output column order for each dataset (also the accumulator layout)
+DATASET_COLUMNS = {
+    'assessments': ['district', 'year', 'subject', 'grade_band',
+                    'proficient_pct', 'tested_n', 'source_url'],
+    'enrollment': ['district', 'year', 'enrollment_total', 'source_url'],
+    'levy': ['district', 'fiscal_year', 'levy_pct_change',
+             'levy_limit', 'proposed_levy', 'source_url'],
+    'expenditures': ['district', 'school_year', 'category', 'amount_total',
+                     'per_pupil', 'dcaadm', 'source_url'],
+    'graduation': ['district', 'year', 'metric', 'value_pct',
+                   'cohort_n', 'source_url'],
+    'pathways': ['district', 'year', 'pathway', 'value_pct',
+                 'cohort_n', 'source_url'],
+}
+
+# Numeric dtypes per dataset. Without these, columns that mix ints with ''
+# placeholders (tested_n, cohort_n) come out as object dtype, which slows
+# frame construction and writes and blocks the Parquet fast path. Nullable
+# Int32 represents the missing counts without falling back to object.
+DATASET_DTYPES = {
+    'assessments': {'year': 'Int32', 'proficient_pct': 'float64', 'tested_n': 'Int32'},
+    'enrollment': {'year': 'Int32', 'enrollment_total': 'Int32'},
+    'levy': {'levy_pct_change': 'float64'},
+    'expenditures': {'amount_total': 'float64', 'per_pupil': 'float64', 'dcaadm': 'float64'},
+    'graduation': {'year': 'Int32', 'value_pct': 'float64', 'cohort_n': 'Int32'},
+    'pathways': {'year': 'Int32', 'value_pct': 'float64', 'cohort_n': 'Int32'},
+}
+
+
+def read_cache_bytes(filepath: Path) -> bytes:
+    """Read a cached page as bytes, decompressing .zst files transparently.
+
+    The fetcher stores HTML as zstd-compressed .html.zst; older caches may
+    still contain plain .html files, so both are supported. lxml accepts the
+    bytes directly and detects the encoding itself, so callers only decode
+    when they genuinely need a str.
+    """
+    raw = filepath.read_bytes()
+    if filepath.suffix == '.zst':
+        raw = zstd.decompress(raw)
+    return raw
+
+
+def cache_stem(filepath: Path) -> str:
+    """Return the cache filename with .html/.zst suffixes stripped."""
+    name = filepath.name
+    for suffix in ('.zst', '.html'):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    return name
+
+
+def parse_assessment_html(filepath: Path, district: str, year: int,
+                          subject: str, source_url: str) -> List[Dict]:
+    """Parse NYSED assessment HTML page, returning assessment records."""
+    logger.info(f"Parsing assessment data: {filepath.name}")
+    records: List[Dict] = []
+
+    try:
+        # Cheap bytes scan first: error pages and redirects have no tables,
+        # and memchr-speed rejection beats a full parse
+        data = read_cache_bytes(filepath)
+        if b'<table' not in data.lower():
+            logger.warning(f"No tables found in {filepath.name}")
+            return records
+
+        # Parse all tables at once; pandas + lxml do the traversal and
+        # per-cell regex work at C level instead of a nested Python scan.
+        # This is a simplified parser - actual NYSED format may vary
+        try:
+            # keep_default_na leaves empty cells as '' so count/grade columns
+            # stay object dtype; otherwise one blank cell floats the column
+            # and "120" round-trips through astype(str) as "120.0"
+            tables = pd.read_html(StringIO(data.decode('utf-8', errors='ignore')),
+                                  flavor='lxml', keep_default_na=False)
+        except ValueError:
+            logger.warning(f"No tables found in {filepath.name}")
+            return records
+
+        for table_df in tables:
+            if table_df.shape[1] < 3:
+                continue
+            str_df = table_df.astype(str)
+
+            # Column-wise vectorized extraction: grade-like cells, percentage
+            # values, and plausible tested-N counts
+            grade_mask = str_df.apply(
+                lambda col: col.str.contains('grade', case=False, regex=False) | col.str.isdigit())
+            pct_ext = str_df.apply(lambda col: col.str.extract(_PCT_RE.pattern, expand=False))
+            n_ext = str_df.apply(
+                lambda col: pd.to_numeric(col.str.extract(_INT_RE.pattern, expand=False),
+                                          errors='coerce'))
+            n_ext = n_ext.where(n_ext > 10)  # Reasonable N
+
+            for idx in str_df.index:
+                if not grade_mask.loc[idx].any():
+                    continue
+                pct_row = pct_ext.loc[idx].dropna()
+                if pct_row.empty:
+                    continue
+                grade_band = str_df.loc[idx, grade_mask.loc[idx].idxmax()]
+                n_row = n_ext.loc[idx].dropna()
+                records.append({
+                    'district': district,
+                    'year': year,
+                    'subject': subject,
+                    'grade_band': grade_band,
+                    'proficient_pct': float(pct_row.iloc[0]),
+                    'tested_n': int(n_row.iloc[0]) if not n_row.empty else '',
+                    'source_url': source_url
+                })
 
-class DataNormalizer:
-    """Normalize raw HTML data to structured formats."""
+    except Exception as e:
+        logger.warning(f"Error parsing {filepath.name}: {e}")
 
-    def __init__(self):
-        OUT_DATA_DIR.mkdir(parents=True, exist_ok=True)
-        self.assessments: List[Dict] = []
-        self.enrollments: List[Dict] = []
-        self.levies: List[Dict] = []
-        self.expenditures: List[Dict] = []
-        self.graduations: List[Dict] = []
-        self.pathways: List[Dict] = []
-
-    def parse_assessment_html(self, filepath: Path, district: str, year: int, subject: str, source_url: str):
-        """Parse NYSED assessment HTML page."""
-        logger.info(f"Parsing assessment data: {filepath.name}")
-        
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                soup = BeautifulSoup(f.read(), 'lxml')
-            
-            # Look for assessment tables
-            # NYSED typically has tables with grade-level proficiency data
-            tables = soup.find_all('table')
-            
-            if not tables:
-                logger.warning(f"No tables found in {filepath.name}")
-                return
-            
-            # Try to find proficiency data in tables
-            # This is a simplified parser - actual NYSED format may vary
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 3:
-                        # Look for grade band and proficiency percentage
-                        cell_texts = [cell.get_text(strip=True) for cell in cells]
-                        
-                        # Try to identify grade information
-                        for i, text in enumerate(cell_texts):
-                            if 'grade' in text.lower() or text.isdigit():
-                                # Try to extract proficiency percentage from adjacent cells
-                                for j in range(len(cell_texts)):
-                                    # Look for percentage values
-                                    pct_match = re.search(r'(\d+(?:\.\d+)?)\s*%', cell_texts[j])
-                                    if pct_match:
-                                        try:
-                                            proficient_pct = float(pct_match.group(1))
-                                            # Look for N tested
-                                            tested_n = None
-                                            for k in range(len(cell_texts)):
-                                                n_match = re.search(r'^(\d+)$', cell_texts[k])
-                                                if n_match and int(n_match.group(1)) > 10:  # Reasonable N
-                                                    tested_n = int(n_match.group(1))
-                                                    break
-                                            
-                                            self.assessments.append({
-                                                'district': district,
-                                                'year': year,
-                                                'subject': subject,
-                                                'grade_band': cell_texts[i] if i < len(cell_texts) else 'All',
-                                                'proficient_pct': proficient_pct,
-                                                'tested_n': tested_n or '',
-                                                'source_url': source_url
-                                            })
+    return records
+
+
+def parse_enrollment_html(filepath: Path, district: str, year: int,
+                          source_url: str) -> List[Dict]:
+    """Parse NYSED enrollment HTML page, returning enrollment records."""
+    logger.info(f"Parsing enrollment data: {filepath.name}")
+    records: List[Dict] = []
+
+    try:
+        data = read_cache_bytes(filepath)
+        if b'<table' not in data.lower():
+            logger.warning(f"No tables found in {filepath.name}")
+            return records
+        root = lxml_html.fromstring(data)
+
+        # Look for total enrollment number
+        # NYSED pages typically have "Total" or "All Students" row
+        tables = root.xpath('//table')
+
+        for table in tables:
+            rows = table.xpath('.//tr')
+            for row in rows:
+                cells = row.xpath('.//td|.//th')
+                if not cells:
+                    continue
+
+                # Look for "Total" or "All" in first column; checking just the
+                # first cell skips text extraction for the vast majority of
+                # rows that can't match
+                first = cells[0].text_content().strip().lower()
+                if 'total' not in first and 'all' not in first:
+                    continue
+
+                # Try to find enrollment number
+                for cell in cells[1:]:
+                    # Look for a reasonable enrollment number (100-20000);
+                    # isdecimal is a C character-class scan, no regex needed
+                    s = cell.text_content().strip().replace(',', '')
+                    if s.isdecimal() and 100 <= int(s) <= 20000:
+                        records.append({
+                            'district': district,
+                            'year': year,
+                            'enrollment_total': int(s),
+                            'source_url': source_url
+                        })
+                        return records
+
+    except Exception as e:
+        logger.warning(f"Error parsing {filepath.name}: {e}")
+
+    return records
+
+
+def parse_budget_html(filepath: Path, district: str, source_url: str) -> List[Dict]:
+    """Parse district budget HTML page for levy information."""
+    logger.info(f"Parsing budget data: {filepath.name}")
+    records: List[Dict] = []
+
+    try:
+        data = read_cache_bytes(filepath)
+        if b'levy' not in data.lower():
+            logger.warning(f"No levy information found in {filepath.name}")
+            return records
+        root = lxml_html.fromstring(data)
+
+        # Look for levy-related keywords
+        text = root.text_content()
+
+        # One pass over the page text: take the first fiscal year, levy
+        # percentage, levy limit, and proposed levy, stopping early once all
+        # four are found
+        fiscal_year = ""
+        levy_pct = None
+        levy_limit = ""
+        proposed_levy = ""
+        for m in _BUDGET_RE.finditer(text):
+            if m.group('fy') is not None:
+                if not fiscal_year:
+                    fiscal_year = f"20{m.group('fy1')}-20{m.group('fy2')}"
+            elif m.group('levy_limit') is not None:
+                if not levy_limit:
+                    levy_limit = m.group('levy_limit_val').replace(',', '')
+            elif m.group('proposed') is not None:
+                if not proposed_levy:
+                    proposed_levy = m.group('proposed_val').replace(',', '')
+            elif m.group('levy_pct') is not None:
+                if levy_pct is None:
+                    levy_pct = float(m.group('levy_pct_val'))
+            if fiscal_year and levy_limit and proposed_levy and levy_pct is not None:
+                break
+
+        if levy_pct or levy_limit or proposed_levy:
+            records.append({
+                'district': district,
+                'fiscal_year': fiscal_year,
+                'levy_pct_change': levy_pct if levy_pct is not None else '',
+                'levy_limit': levy_limit,
+                'proposed_levy': proposed_levy,
+                'source_url': source_url
+            })
+
+    except Exception as e:
+        logger.warning(f"Error parsing {filepath.name}: {e}")
+
+    return records
+
+
+def parse_gradrate_html(filepath: Path, district: str, year: int,
+                        source_url: str) -> List[Dict]:
+    """Parse NYSED graduation rate HTML page, returning graduation records."""
+    logger.info(f"Parsing graduation rate data: {filepath.name}")
+    records: List[Dict] = []
+    try:
+        data = read_cache_bytes(filepath)
+        if b'<table' not in data.lower():
+            logger.warning(f"No tables found in {filepath.name}")
+            return records
+        root = lxml_html.fromstring(data)
+        tables = root.xpath('//table')
+        for table in tables:
+            rows = table.xpath('.//tr')
+            for row in rows:
+                cells = row.xpath('.//td|.//th')
+                cell_texts = [cell.text_content().strip() for cell in cells]
+                # Look for cohort graduation rates
+                for i, text in enumerate(cell_texts):
+                    text_lower = text.lower()
+                    metric = None
+                    if '4' in text_lower and ('year' in text_lower or 'august' in text_lower):
+                        metric = 'grad_4yr_aug'
+                    elif '5' in text_lower and 'year' in text_lower:
+                        metric = 'grad_5yr'
+                    elif '6' in text_lower and 'year' in text_lower:
+                        metric = 'grad_6yr'
+                    if metric:
+                        for j in range(len(cell_texts)):
+                            pct_match = _PCT_OPT_RE.search(cell_texts[j])
+                            if pct_match and j != i:
+                                value = float(pct_match.group(1))
+                                if 0 <= value <= 100:
+                                    cohort_n = None
+                                    for k in range(len(cell_texts)):
+                                        s = cell_texts[k].replace(',', '')
+                                        if s.isdecimal() and int(s) > 10:
+                                            cohort_n = int(s)
                                             break
-                                        except (ValueError, IndexError):
-                                            continue
-                                break
-        
-        except Exception as e:
-            logger.warning(f"Error parsing {filepath.name}: {e}")
-
-    def parse_enrollment_html(self, filepath: Path, district: str, year: int, source_url: str):
-        """Parse NYSED enrollment HTML page."""
-        logger.info(f"Parsing enrollment data: {filepath.name}")
-        
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                soup = BeautifulSoup(f.read(), 'lxml')
-            
-            # Look for total enrollment number
-            # NYSED pages typically have "Total" or "All Students" row
-            tables = soup.find_all('table')
-            
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    cell_texts = [cell.get_text(strip=True) for cell in cells]
-                    
-                    # Look for "Total" or "All" in first column
-                    if cell_texts and ('total' in cell_texts[0].lower() or 'all' in cell_texts[0].lower()):
-                        # Try to find enrollment number
-                        for text in cell_texts[1:]:
-                            # Look for a reasonable enrollment number (100-20000)
-                            match = re.search(r'^(\d{3,5})$', text.replace(',', ''))
-                            if match:
-                                enrollment = int(match.group(1))
-                                if 100 <= enrollment <= 20000:
-                                    self.enrollments.append({
+                                    records.append({
                                         'district': district,
                                         'year': year,
-                                        'enrollment_total': enrollment,
+                                        'metric': metric,
+                                        'value_pct': value,
+                                        'cohort_n': cohort_n or '',
                                         'source_url': source_url
                                     })
-                                    return
-        
-        except Exception as e:
-            logger.warning(f"Error parsing {filepath.name}: {e}")
-
-    def parse_budget_html(self, filepath: Path, district: str, source_url: str):
-        """Parse district budget HTML page for levy information."""
-        logger.info(f"Parsing budget data: {filepath.name}")
-        
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                soup = BeautifulSoup(content, 'lxml')
-            
-            # Look for levy-related keywords
-            text = soup.get_text()
-            
-            # Try to extract fiscal year
-            fiscal_year_match = re.search(r'20(\d{2})[/-]20?(\d{2})', text)
-            fiscal_year = f"20{fiscal_year_match.group(1)}-20{fiscal_year_match.group(2)}" if fiscal_year_match else ""
-            
-            # Try to extract levy percentage change
-            levy_pct_match = re.search(r'levy.*?(\d+(?:\.\d+)?)\s*%', text, re.IGNORECASE)
-            levy_pct = float(levy_pct_match.group(1)) if levy_pct_match else None
-            
-            # Try to extract levy amounts (in millions/dollars)
-            levy_limit_match = re.search(r'levy\s+limit.*?\$?([\d,]+(?:\.\d+)?)', text, re.IGNORECASE)
-            levy_limit = levy_limit_match.group(1).replace(',', '') if levy_limit_match else ""
-            
-            proposed_levy_match = re.search(r'proposed\s+levy.*?\$?([\d,]+(?:\.\d+)?)', text, re.IGNORECASE)
-            proposed_levy = proposed_levy_match.group(1).replace(',', '') if proposed_levy_match else ""
-            
-            if levy_pct or levy_limit or proposed_levy:
-                self.levies.append({
-                    'district': district,
-                    'fiscal_year': fiscal_year,
-                    'levy_pct_change': levy_pct if levy_pct is not None else '',
-                    'levy_limit': levy_limit,
-                    'proposed_levy': proposed_levy,
-                    'source_url': source_url
-                })
-        
-        except Exception as e:
-            logger.warning(f"Error parsing {filepath.name}: {e}")
-
-    def parse_gradrate_html(self, filepath: Path, district: str, year: int, source_url: str):
-        """Parse NYSED graduation rate HTML page."""
-        logger.info(f"Parsing graduation rate data: {filepath.name}")
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                soup = BeautifulSoup(f.read(), 'lxml')
-            tables = soup.find_all('table')
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    cell_texts = [cell.get_text(strip=True) for cell in cells]
-                    # Look for cohort graduation rates
+                                    break
+                        break
+    except Exception as e:
+        logger.warning(f"Error parsing {filepath.name}: {e}")
+    return records
+
+
+def parse_pathways_html(filepath: Path, district: str, year: int,
+                        source_url: str) -> List[Dict]:
+    """Parse NYSED graduation pathways HTML page, returning pathway records."""
+    logger.info(f"Parsing graduation pathways data: {filepath.name}")
+    records: List[Dict] = []
+    try:
+        data = read_cache_bytes(filepath)
+        if b'<table' not in data.lower():
+            logger.warning(f"No tables found in {filepath.name}")
+            return records
+        root = lxml_html.fromstring(data)
+        tables = root.xpath('//table')
+        pathway_keywords = {
+            'Advanced Regents': ['advanced regents', 'advanced designation'],
+            'Regents': ['regents diploma', 'regents'],
+            'Local': ['local diploma', 'local'],
+            'CDOS': ['cdos', 'career development', 'cte'],
+        }
+        for table in tables:
+            rows = table.xpath('.//tr')
+            for row in rows:
+                cells = row.xpath('.//td|.//th')
+                # Computed exactly once per row; text_content walks the
+                # subtree in C, unlike get_text's Python recursion
+                cell_texts = [cell.text_content().strip() for cell in cells]
+                for pathway_name, keywords in pathway_keywords.items():
                     for i, text in enumerate(cell_texts):
                         text_lower = text.lower()
-                        metric = None
-                        if '4' in text_lower and ('year' in text_lower or 'august' in text_lower):
-                            metric = 'grad_4yr_aug'
-                        elif '5' in text_lower and 'year' in text_lower:
-                            metric = 'grad_5yr'
-                        elif '6' in text_lower and 'year' in text_lower:
-                            metric = 'grad_6yr'
-                        if metric:
+                        if any(kw in text_lower for kw in keywords):
+                            # Avoid matching "Advanced Regents" when looking for "Regents"
+                            if pathway_name == 'Regents' and 'advanced' in text_lower:
+                                continue
                             for j in range(len(cell_texts)):
-                                pct_match = re.search(r'(\d+(?:\.\d+)?)\s*%?', cell_texts[j])
+                                pct_match = _PCT_OPT_RE.search(cell_texts[j])
                                 if pct_match and j != i:
                                     value = float(pct_match.group(1))
                                     if 0 <= value <= 100:
                                         cohort_n = None
                                         for k in range(len(cell_texts)):
-                                            n_match = re.search(r'^(\d+)$', cell_texts[k].replace(',', ''))
-                                            if n_match and int(n_match.group(1)) > 10:
-                                                cohort_n = int(n_match.group(1))
+                                            s = cell_texts[k].replace(',', '')
+                                            if s.isdecimal() and int(s) > 10:
+                                                cohort_n = int(s)
                                                 break
-                                        self.graduations.append({
+                                        records.append({
                                             'district': district,
                                             'year': year,
-                                            'metric': metric,
+                                            'pathway': pathway_name,
                                             'value_pct': value,
                                             'cohort_n': cohort_n or '',
                                             'source_url': source_url
                                         })
                                         break
                             break
-        except Exception as e:
-            logger.warning(f"Error parsing {filepath.name}: {e}")
-
-    def parse_pathways_html(self, filepath: Path, district: str, year: int, source_url: str):
-        """Parse NYSED graduation pathways HTML page."""
-        logger.info(f"Parsing graduation pathways data: {filepath.name}")
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                soup = BeautifulSoup(f.read(), 'lxml')
-            tables = soup.find_all('table')
-            pathway_keywords = {
-                'Advanced Regents': ['advanced regents', 'advanced designation'],
-                'Regents': ['regents diploma', 'regents'],
-                'Local': ['local diploma', 'local'],
-                'CDOS': ['cdos', 'career development', 'cte'],
-            }
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    cell_texts = [cell.get_text(strip=True) for cell in cells]
-                    for pathway_name, keywords in pathway_keywords.items():
-                        for i, text in enumerate(cell_texts):
-                            text_lower = text.lower()
-                            if any(kw in text_lower for kw in keywords):
-                                # Avoid matching "Advanced Regents" when looking for "Regents"
-                                if pathway_name == 'Regents' and 'advanced' in text_lower:
-                                    continue
-                                for j in range(len(cell_texts)):
-                                    pct_match = re.search(r'(\d+(?:\.\d+)?)\s*%?', cell_texts[j])
-                                    if pct_match and j != i:
-                                        value = float(pct_match.group(1))
-                                        if 0 <= value <= 100:
-                                            cohort_n = None
-                                            for k in range(len(cell_texts)):
-                                                n_match = re.search(r'^(\d+)$', cell_texts[k].replace(',', ''))
-                                                if n_match and int(n_match.group(1)) > 10:
-                                                    cohort_n = int(n_match.group(1))
-                                                    break
-                                            self.pathways.append({
-                                                'district': district,
-                                                'year': year,
-                                                'pathway': pathway_name,
-                                                'value_pct': value,
-                                                'cohort_n': cohort_n or '',
-                                                'source_url': source_url
-                                            })
-                                            break
-                                break
-        except Exception as e:
-            logger.warning(f"Error parsing {filepath.name}: {e}")
-
-    def parse_fiscal_profiles_xlsx(self, filepath: Path, source_url: str):
-        """Parse NYSED Fiscal Profiles XLSX for expenditure data."""
-        logger.info(f"Parsing fiscal profiles XLSX: {filepath.name}")
-
-        try:
-            # Load districts config for mapping district_code6 -> display name
-            config_file = CONFIG_DIR / "districts.json"
-            if not config_file.exists():
-                logger.warning("districts.json not found, skipping fiscal profiles")
-                return
-            with open(config_file) as f:
-                config_districts = json.load(f)
-
-            code6_to_name = {}
-            for d in config_districts:
-                code6 = str(d["instid"])[:6].zfill(6)
-                code6_to_name[code6] = d["name"]
-
-            fiscal_df = pd.read_excel(filepath, sheet_name="Data", engine="openpyxl")
-
-            # Normalize district code
-            if "DISTRICT" not in fiscal_df.columns:
-                logger.warning("DISTRICT column not found in fiscal profiles XLSX")
-                return
-            fiscal_df["district_code6"] = fiscal_df["DISTRICT"].astype(str).str.zfill(6)
-
-            # Identify year column
-            year_col = None
+    except Exception as e:
+        logger.warning(f"Error parsing {filepath.name}: {e}")
+    return records
+
+
+@functools.lru_cache(maxsize=1)
+def _district_code6_map() -> Optional[Dict[str, str]]:
+    """Map 6-digit district codes to display names, loaded once per process."""
+    config_file = CONFIG_DIR / "districts.json"
+    if not config_file.exists():
+        return None
+    config_districts = orjson.loads(config_file.read_bytes())
+    return {str(d["instid"])[:6].zfill(6): d["name"] for d in config_districts}
+
+
+def parse_fiscal_profiles_xlsx(filepath: Path, source_url: str) -> List[Dict]:
+    """Parse NYSED Fiscal Profiles XLSX for expenditure data."""
+    logger.info(f"Parsing fiscal profiles XLSX: {filepath.name}")
+    records: List[Dict] = []
+
+    try:
+        # Districts config maps district_code6 -> display name
+        code6_to_name = _district_code6_map()
+        if code6_to_name is None:
+            logger.warning("districts.json not found, skipping fiscal profiles")
+            return records
+
+        # calamine reads the zipped XML in native code; openpyxl's pure-Python
+        # SAX pass was the slowest single read in the script. The header-only
+        # read lets the full read below load just the ~10 consumed columns
+        # out of the dozens the Data sheet carries.
+        header_cols = list(pd.read_excel(filepath, sheet_name="Data", nrows=0,
+                                         engine="calamine").columns)
+
+        if "DISTRICT" not in header_cols:
+            logger.warning("DISTRICT column not found in fiscal profiles XLSX")
+            return records
+
+        # Upper-case each header once; the lookups below otherwise re-case
+        # every column name per find_col call
+        upper_cols = {str(c).upper(): c for c in header_cols}
+
+        # Identify year column by name
+        year_col = None
+        for name in ("YEAR", "SCHOOL YEAR", "SCHOOL_YEAR", "SY"):
+            if name in upper_cols:
+                year_col = upper_cols[name]
+                break
+
+        # Column mapping helpers - find columns by partial match
+        def find_col(patterns):
+            for p in patterns:
+                p_upper = p.upper()
+                for upper, original in upper_cols.items():
+                    if p_upper in upper:
+                        return original
+            return None
+
+        total_col = find_col(["TOTAL EXPENDITURES"])
+        edu_col = find_col(["IE2", "INSTRUCTIONAL EXPENDITURES INCLUDING FRINGE"])
+        boe_col = find_col(["BOARD OF EDUCATION"])
+        ca_col = find_col(["CENTRAL ADMINISTRATION"])
+        dsp_col = find_col(["DEBT SERVICE PRINC"])
+        dsi_col = find_col(["DEBT SERVICE INTEREST"])
+        cap_transfer_col = find_col(["A9950", "INTERFUND TRANSFERS TO CAPITAL"])
+        dcaadm_col = find_col(["DCAADM"])
+
+        if not total_col or not dcaadm_col:
+            logger.warning("Required columns (TOTAL EXPENDITURES, DCAADM) not found")
+            return records
+
+        if year_col is not None:
+            wanted = {"DISTRICT", year_col, total_col, edu_col, boe_col, ca_col,
+                      dsp_col, dsi_col, cap_transfer_col, dcaadm_col}
+            wanted.discard(None)
+            fiscal_df = pd.read_excel(filepath, sheet_name="Data",
+                                      usecols=list(wanted), engine="calamine")
+        else:
+            # No named year column: read everything so we can sniff a column
+            # with year-like values
+            fiscal_df = pd.read_excel(filepath, sheet_name="Data", engine="calamine")
             for col in fiscal_df.columns:
-                if str(col).upper() in ("YEAR", "SCHOOL YEAR", "SCHOOL_YEAR", "SY"):
+                sample = fiscal_df[col].dropna().astype(str)
+                if sample.str.match(r"^\d{4}-\d{2}$").any():
                     year_col = col
                     break
-            if year_col is None:
-                # Try to find a column containing year-like values
-                for col in fiscal_df.columns:
-                    sample = fiscal_df[col].dropna().astype(str)
-                    if sample.str.match(r"^\d{4}-\d{2}$").any():
-                        year_col = col
-                        break
 
-            # Column mapping helpers - find columns by partial match
-            def find_col(patterns):
-                for p in patterns:
-                    for c in fiscal_df.columns:
-                        if p.upper() in str(c).upper():
-                            return c
-                return None
-
-            total_col = find_col(["TOTAL EXPENDITURES"])
-            edu_col = find_col(["IE2", "INSTRUCTIONAL EXPENDITURES INCLUDING FRINGE"])
-            boe_col = find_col(["BOARD OF EDUCATION"])
-            ca_col = find_col(["CENTRAL ADMINISTRATION"])
-            dsp_col = find_col(["DEBT SERVICE PRINC"])
-            dsi_col = find_col(["DEBT SERVICE INTEREST"])
-            cap_transfer_col = find_col(["A9950", "INTERFUND TRANSFERS TO CAPITAL"])
-            dcaadm_col = find_col(["DCAADM"])
-
-            if not total_col or not dcaadm_col:
-                logger.warning("Required columns (TOTAL EXPENDITURES, DCAADM) not found")
-                return
-
-            for _, row in fiscal_df.iterrows():
-                code6 = row["district_code6"]
-                if code6 not in code6_to_name:
-                    continue
+        fiscal_df["district_code6"] = fiscal_df["DISTRICT"].astype(str).str.zfill(6)
+
+        # Whole-column arithmetic instead of iterrows: the per-row version
+        # boxed every value to a Python scalar and called pd.to_numeric per
+        # cell, which dominated this script's runtime on the state-wide file
+        df = fiscal_df[fiscal_df["district_code6"].isin(code6_to_name)].copy()
+        pupils = pd.to_numeric(df[dcaadm_col], errors="coerce")
+        df = df[pupils.notna() & (pupils != 0)]
+        pupils = pupils.loc[df.index]
+
+        def col_numeric(col):
+            # Missing optional columns contribute 0, same as the NaN fill
+            if col is None:
+                return pd.Series(0.0, index=df.index)
+            return pd.to_numeric(df[col], errors="coerce").fillna(0)
+
+        total = col_numeric(total_col)
+        edu = col_numeric(edu_col)
+        admin = col_numeric(boe_col) + col_numeric(ca_col)
+        capital = col_numeric(dsp_col) + col_numeric(dsi_col) + col_numeric(cap_transfer_col)
+        operational = total - edu - admin - capital
+
+        district = df["district_code6"].map(code6_to_name)
+        school_year = df[year_col].astype(str) if year_col else pd.Series("", index=df.index)
+
+        negative = operational < -1  # small epsilon tolerance
+        for district_name, sy, op in zip(district[negative], school_year[negative],
+                                         operational[negative]):
+            logger.warning(
+                f"Negative operational for {district_name} {sy}: {op:.2f}, skipping"
+            )
+        keep = ~negative
+
+        district_arr = district[keep].to_numpy()
+        year_arr = school_year[keep].to_numpy()
+        pupils_kept = pupils[keep]
+        pupils_arr = pupils_kept.round(2).to_numpy()
+        category_arrays = [
+            (category, amounts[keep].round(2).to_numpy(),
+             (amounts[keep] / pupils_kept).round(2).to_numpy())
+            for category, amounts in [
+                ("Educational", edu),
+                ("Administrative", admin),
+                ("Capital", capital),
+                ("Operational", operational),
+            ]
+        ]
+        for i in range(len(district_arr)):
+            for category, amount_arr, per_pupil_arr in category_arrays:
+                records.append({
+                    "district": district_arr[i],
+                    "school_year": year_arr[i],
+                    "category": category,
+                    "amount_total": float(amount_arr[i]),
+                    "per_pupil": float(per_pupil_arr[i]),
+                    "dcaadm": float(pupils_arr[i]),
+                    "source_url": source_url,
+                })
 
-                district_name = code6_to_name[code6]
-                school_year = str(row[year_col]) if year_col else ""
+        logger.info(f"Parsed {len(records)} expenditure records")
 
-                pupils = pd.to_numeric(row.get(dcaadm_col), errors="coerce") if dcaadm_col else None
-                if pupils is None or pd.isna(pupils) or pupils == 0:
-                    continue
+    except Exception as e:
+        logger.warning(f"Error parsing fiscal profiles XLSX: {e}")
 
-                total = pd.to_numeric(row.get(total_col), errors="coerce") if total_col else 0
-                edu = pd.to_numeric(row.get(edu_col), errors="coerce") if edu_col else 0
-                boe = pd.to_numeric(row.get(boe_col), errors="coerce") if boe_col else 0
-                ca = pd.to_numeric(row.get(ca_col), errors="coerce") if ca_col else 0
-                dsp = pd.to_numeric(row.get(dsp_col), errors="coerce") if dsp_col else 0
-                dsi = pd.to_numeric(row.get(dsi_col), errors="coerce") if dsi_col else 0
-                cap_xfer = pd.to_numeric(row.get(cap_transfer_col), errors="coerce") if cap_transfer_col else 0
-
-                # Treat NaN as 0 for components
-                total = 0 if pd.isna(total) else total
-                edu = 0 if pd.isna(edu) else edu
-                boe = 0 if pd.isna(boe) else boe
-                ca = 0 if pd.isna(ca) else ca
-                dsp = 0 if pd.isna(dsp) else dsp
-                dsi = 0 if pd.isna(dsi) else dsi
-                cap_xfer = 0 if pd.isna(cap_xfer) else cap_xfer
-
-                admin = boe + ca
-                capital = dsp + dsi + cap_xfer
-                operational = total - edu - admin - capital
-
-                if operational < -1:  # small epsilon tolerance
-                    logger.warning(
-                        f"Negative operational for {district_name} {school_year}: {operational:.2f}, skipping"
-                    )
-                    continue
+    return records
+
+
+def _source_kind(url: str, name: str) -> Optional[str]:
+    """Classify a sources.json entry by URL/filename into a dataset key."""
+    if 'assessment38.php' in url:
+        return 'assessments'
+    if 'enrollment.php' in url:
+        return 'enrollments'
+    if '_budget.html' in name:
+        return 'levies'
+    if name.endswith('.xlsx') or ('fiscal-analysis-research' in url and '.xlsx' in url):
+        return 'expenditures'
+    if 'gradrate.php' in url:
+        if '_gradrate_' in name:
+            return 'graduations'
+        if '_pathways_' in name:
+            return 'pathways'
+    return None
+
+
+def _query_field(url: str, field: str) -> Optional[str]:
+    """Return the first value of a query-string field, or None."""
+    return parse_qs(urlparse(url).query).get(field, [None])[0]
+
+
+def _query_year(url: str) -> Optional[int]:
+    """Return the year query field as an int, or None if absent/malformed."""
+    year = _query_field(url, 'year')
+    return int(year) if year and year.isdigit() else None
+
+
+def _handle_assessment(filepath: Path, url: str) -> List[Dict]:
+    # One C-level parse of the query string instead of a regex search per field
+    query = parse_qs(urlparse(url).query)
+    instid = query.get('instid', [None])[0]
+    year = query.get('year', [None])[0]
+    subject = query.get('subject', [None])[0]
+    if not (instid and year and year.isdigit() and subject):
+        return []
+    district = cache_stem(filepath).split('_assessment_')[0].replace('_', ' ').title()
+    return parse_assessment_html(filepath, district, int(year), subject.upper(), url)
 
-                for category, amount_total in [
-                    ("Educational", edu),
-                    ("Administrative", admin),
-                    ("Capital", capital),
-                    ("Operational", operational),
-                ]:
-                    per_pupil = round(amount_total / pupils, 2) if pupils else None
-                    self.expenditures.append({
-                        "district": district_name,
-                        "school_year": school_year,
-                        "category": category,
-                        "amount_total": round(amount_total, 2),
-                        "per_pupil": per_pupil,
-                        "dcaadm": round(pupils, 2),
-                        "source_url": source_url,
-                    })
-
-            logger.info(f"Parsed {len(self.expenditures)} expenditure records")
-
-        except Exception as e:
-            logger.warning(f"Error parsing fiscal profiles XLSX: {e}")
+
+def _handle_enrollment(filepath: Path, url: str) -> List[Dict]:
+    year = _query_year(url)
+    if year is None:
+        return []
+    district = cache_stem(filepath).split('_enrollment_')[0].replace('_', ' ').title()
+    return parse_enrollment_html(filepath, district, year, url)
+
+
+def _handle_budget(filepath: Path, url: str) -> List[Dict]:
+    district = cache_stem(filepath).replace('_budget', '').replace('_', ' ').title()
+    return parse_budget_html(filepath, district, url)
+
+
+def _handle_fiscal_profiles(filepath: Path, url: str) -> List[Dict]:
+    return parse_fiscal_profiles_xlsx(filepath, url)
+
+
+def _handle_gradrate(filepath: Path, url: str) -> List[Dict]:
+    year = _query_year(url)
+    if year is None:
+        return []
+    district = cache_stem(filepath).split('_gradrate_')[0].replace('_', ' ').title()
+    return parse_gradrate_html(filepath, district, year, url)
+
+
+def _handle_pathways(filepath: Path, url: str) -> List[Dict]:
+    year = _query_year(url)
+    if year is None:
+        return []
+    district = cache_stem(filepath).split('_pathways_')[0].replace('_', ' ').title()
+    return parse_pathways_html(filepath, district, year, url)
+
+
+# One classification per source entry, then a dict lookup, instead of walking
+# an order-sensitive if/elif chain of substring tests for every record
+_SOURCE_HANDLERS = {
+    'assessments': _handle_assessment,
+    'enrollments': _handle_enrollment,
+    'levies': _handle_budget,
+    'expenditures': _handle_fiscal_profiles,
+    'graduations': _handle_gradrate,
+    'pathways': _handle_pathways,
+}
+
+
+def parse_cached_source(source: Dict) -> Dict[str, List[Dict]]:
+    """Parse one sources.json entry into normalized records.
+
+    Runs in worker processes, so it takes the plain source dict and returns
+    a mapping of dataset name -> records for the parent to merge.
+    """
+    filepath = Path(source['filepath'])
+    url = source['url']
+    kind = _source_kind(url, filepath.name)
+    if kind is None:
+        return {}
+    return {kind: _SOURCE_HANDLERS[kind](filepath, url)}
+
+
+class DataNormalizer:
+    """Normalize raw HTML data to structured formats."""
+
+    # Maps parse_cached_source result keys to DATASET_COLUMNS stems
+    _PARSE_KEY_TO_STEM = {
+        'assessments': 'assessments',
+        'enrollments': 'enrollment',
+        'levies': 'levy',
+        'expenditures': 'expenditures',
+        'graduations': 'graduation',
+        'pathways': 'pathways',
+    }
+
+    def __init__(self):
+        OUT_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        # Column-wise (SoA) accumulators: one list per output column, so
+        # DataFrames are built columnar without pandas' row-wise inference
+        self.columns: Dict[str, Dict[str, List]] = {
+            stem: {col: [] for col in cols}
+            for stem, cols in DATASET_COLUMNS.items()
+        }
+
+    def _merge_parsed(self, parsed: Dict[str, List[Dict]]):
+        """Merge one worker's parse result into the column accumulators."""
+        for key, records in parsed.items():
+            dataset = self.columns[self._PARSE_KEY_TO_STEM[key]]
+            for record in records:
+                for col, values in dataset.items():
+                    values.append(record.get(col, ''))
+
+    @staticmethod
+    def _parse_cache_key(source: Dict) -> Optional[str]:
+        """Cache key for one source entry, or None if it can't be cached.
+
+        The key includes the source URL, not just the content hash: identical
+        bytes are routinely fetched for different districts/years/subjects
+        (NYSED "no data" pages), and the parsed records carry that per-source
+        identity, so equal content must still cache independently.
+        """
+        sha = source.get('sha256')
+        return f"{sha}:{source['url']}:{PARSER_VERSION}" if sha else None
 
     def process_cached_files(self):
-        """Process all cached files."""
+        """Process all cached files, parsing them in parallel across cores."""
         # Load sources metadata
         sources_file = CACHE_DIR / "sources.json"
         if not sources_file.exists():
             logger.error("sources.json not found in cache/")
             return
-        
-        with open(sources_file) as f:
-            sources = json.load(f)
-        
-        # Process each source
-        for source in sources:
-            if source['status'] != 'success' or not source.get('filepath'):
-                continue
-            
+
+        # orjson parses the catalog from bytes without an intermediate str;
+        # filtering to successful entries here keeps the dispatch path clean
+        sources = orjson.loads(sources_file.read_bytes())
+        successful = [s for s in sources if s['status'] == 'success' and s.get('filepath')]
+
+        tasks = []
+        for source in successful:
             filepath = Path(source['filepath'])
             if not filepath.exists():
                 logger.warning(f"File not found: {filepath}")
                 continue
-            
-            url = source['url']
-            
-            # Determine file type and parse accordingly
-            if 'assessment38.php' in url:
-                # Extract district, year, subject from URL
-                instid_match = re.search(r'instid=(\d+)', url)
-                year_match = re.search(r'year=(\d+)', url)
-                subject_match = re.search(r'subject=(\w+)', url)
-                
-                if instid_match and year_match and subject_match:
-                    # Extract district name from filename
-                    district = filepath.stem.split('_assessment_')[0].replace('_', ' ').title()
-                    year = int(year_match.group(1))
-                    subject = subject_match.group(1).upper()
-                    
-                    self.parse_assessment_html(filepath, district, year, subject, url)
-            
-            elif 'enrollment.php' in url:
-                # Extract district, year from URL
-                year_match = re.search(r'year=(\d+)', url)
-                
-                if year_match:
-                    district = filepath.stem.split('_enrollment_')[0].replace('_', ' ').title()
-                    year = int(year_match.group(1))
-                    
-                    self.parse_enrollment_html(filepath, district, year, url)
-            
-            elif '_budget.html' in filepath.name:
-                district = filepath.stem.replace('_budget', '').replace('_', ' ').title()
-                self.parse_budget_html(filepath, district, url)
-
-            elif filepath.suffix == '.xlsx' or ('fiscal-analysis-research' in url and '.xlsx' in url):
-                self.parse_fiscal_profiles_xlsx(filepath, url)
-
-            elif 'gradrate.php' in url and '_gradrate_' in filepath.name:
-                year_match = re.search(r'year=(\d+)', url)
-                if year_match:
-                    district = filepath.stem.split('_gradrate_')[0].replace('_', ' ').title()
-                    year = int(year_match.group(1))
-                    self.parse_gradrate_html(filepath, district, year, url)
-
-            elif 'gradrate.php' in url and '_pathways_' in filepath.name:
-                year_match = re.search(r'year=(\d+)', url)
-                if year_match:
-                    district = filepath.stem.split('_pathways_')[0].replace('_', ' ').title()
-                    year = int(year_match.group(1))
-                    self.parse_pathways_html(filepath, district, year, url)
 
-    def save_data(self):
-        """Save normalized data to CSV and JSON, falling back to seed data if empty."""
-        # Assessments
-        if self.assessments:
-            df = pd.DataFrame(self.assessments)
-            csv_path = OUT_DATA_DIR / "assessments.csv"
-            json_path = OUT_DATA_DIR / "assessments.json"
-            df.to_csv(csv_path, index=False)
-            df.to_json(json_path, orient='records', indent=2)
-            logger.info(f"Saved {len(self.assessments)} assessment records")
-        else:
-            logger.warning("No assessment data parsed from fetched files")
-            seed_csv = SEED_DATA_DIR / "assessments.csv"
-            if seed_csv.exists():
-                logger.info("Copying seed assessments data as fallback")
-                shutil.copy2(seed_csv, OUT_DATA_DIR / "assessments.csv")
-            else:
-                pd.DataFrame(columns=['district', 'year', 'subject', 'grade_band', 
-                                     'proficient_pct', 'tested_n', 'source_url']).to_csv(
-                    OUT_DATA_DIR / "assessments.csv", index=False)
-        
-        # Enrollments
-        if self.enrollments:
-            df = pd.DataFrame(self.enrollments)
-            csv_path = OUT_DATA_DIR / "enrollment.csv"
-            json_path = OUT_DATA_DIR / "enrollment.json"
-            df.to_csv(csv_path, index=False)
-            df.to_json(json_path, orient='records', indent=2)
-            logger.info(f"Saved {len(self.enrollments)} enrollment records")
-        else:
-            logger.warning("No enrollment data found")
-            pd.DataFrame(columns=['district', 'year', 'enrollment_total', 
-                                 'source_url']).to_csv(
-                OUT_DATA_DIR / "enrollment.csv", index=False)
-        
-        # Levies
-        if self.levies:
-            df = pd.DataFrame(self.levies)
-            csv_path = OUT_DATA_DIR / "levy.csv"
-            json_path = OUT_DATA_DIR / "levy.json"
-            df.to_csv(csv_path, index=False)
-            df.to_json(json_path, orient='records', indent=2)
-            logger.info(f"Saved {len(self.levies)} levy records")
-        else:
-            logger.warning("No levy data parsed from fetched files")
-            seed_csv = SEED_DATA_DIR / "levy.csv"
-            if seed_csv.exists():
-                logger.info("Copying seed levy data as fallback")
-                shutil.copy2(seed_csv, OUT_DATA_DIR / "levy.csv")
-            else:
-                pd.DataFrame(columns=['district', 'fiscal_year', 'levy_pct_change',
-                                     'levy_limit', 'proposed_levy', 'source_url']).to_csv(
-                    OUT_DATA_DIR / "levy.csv", index=False)
-        
-        # Expenditures
-        if self.expenditures:
-            df = pd.DataFrame(self.expenditures)
-            csv_path = OUT_DATA_DIR / "expenditures.csv"
-            json_path = OUT_DATA_DIR / "expenditures.json"
-            df.to_csv(csv_path, index=False)
-            df.to_json(json_path, orient='records', indent=2)
-            logger.info(f"Saved {len(self.expenditures)} expenditure records")
-        else:
-            logger.warning("No expenditure data parsed from fetched files")
-            seed_csv = SEED_DATA_DIR / "expenditures.csv"
-            if seed_csv.exists():
-                logger.info("Copying seed expenditures data as fallback")
-                shutil.copy2(seed_csv, OUT_DATA_DIR / "expenditures.csv")
+            tasks.append(source)
+
+        if not tasks:
+            return
+
+        # Parse results are cached on disk keyed by the fetcher's content
+        # hash plus the source URL, so incremental runs only reparse sources
+        # whose bytes changed
+        cache_path = CACHE_DIR / "normalize_cache.json"
+        parse_cache: Dict[str, Dict] = {}
+        if cache_path.exists():
+            try:
+                parse_cache = orjson.loads(cache_path.read_bytes())
+            except orjson.JSONDecodeError:
+                logger.warning("Discarding unreadable normalize_cache.json")
+
+        # Keeping only this run's keys prunes entries for removed files and
+        # old parser versions
+        fresh_cache: Dict[str, Dict] = {}
+        pending = []
+        for source in tasks:
+            key = self._parse_cache_key(source)
+            if key and key in parse_cache:
+                fresh_cache[key] = parse_cache[key]
+                self._merge_parsed(parse_cache[key])
             else:
-                pd.DataFrame(columns=['district', 'school_year', 'category',
-                                     'amount_total', 'per_pupil', 'dcaadm',
-                                     'source_url']).to_csv(
-                    OUT_DATA_DIR / "expenditures.csv", index=False)
-
-        # Graduations
-        if self.graduations:
-            df = pd.DataFrame(self.graduations)
-            csv_path = OUT_DATA_DIR / "graduation.csv"
-            json_path = OUT_DATA_DIR / "graduation.json"
-            df.to_csv(csv_path, index=False)
-            df.to_json(json_path, orient='records', indent=2)
-            logger.info(f"Saved {len(self.graduations)} graduation records")
+                pending.append(source)
+        if len(pending) < len(tasks):
+            logger.info(f"Reusing cached parse results for {len(tasks) - len(pending)} files")
+
+        if NORMALIZE_MAX_WORKERS > 1 and len(pending) > 1:
+            logger.info(f"Parsing {len(pending)} cached files with {NORMALIZE_MAX_WORKERS} workers")
+            with ProcessPoolExecutor(max_workers=NORMALIZE_MAX_WORKERS) as executor:
+                # chunksize amortizes task pickling across the thousands of
+                # small HTML files a full run produces
+                results = executor.map(parse_cached_source, pending, chunksize=16)
+                for source, parsed in zip(pending, results):
+                    self._merge_parsed(parsed)
+                    key = self._parse_cache_key(source)
+                    if key:
+                        fresh_cache[key] = parsed
         else:
-            logger.warning("No graduation data parsed from fetched files")
-            seed_csv = SEED_DATA_DIR / "graduation.csv"
-            if seed_csv.exists():
-                logger.info("Copying seed graduation data as fallback")
-                shutil.copy2(seed_csv, OUT_DATA_DIR / "graduation.csv")
-            else:
-                pd.DataFrame(columns=['district', 'year', 'metric', 'value_pct',
-                                     'cohort_n', 'source_url']).to_csv(
-                    OUT_DATA_DIR / "graduation.csv", index=False)
-
-        # Pathways
-        if self.pathways:
-            df = pd.DataFrame(self.pathways)
-            csv_path = OUT_DATA_DIR / "pathways.csv"
-            json_path = OUT_DATA_DIR / "pathways.json"
+            for source in pending:
+                parsed = parse_cached_source(source)
+                self._merge_parsed(parsed)
+                key = self._parse_cache_key(source)
+                if key:
+                    fresh_cache[key] = parsed
+
+        cache_path.write_bytes(orjson.dumps(fresh_cache))
+
+    def save_dataset(self, stem: str):
+        """Write one dataset as CSV/JSON/Parquet, falling back to seed CSV if empty.
+
+        CSV and JSON are what the frontend and build_specs consume; the
+        zstd-compressed Parquet copy is the fast columnar path for any
+        downstream reader (reads in tens of ms where CSV takes seconds).
+        """
+        csv_path = OUT_DATA_DIR / f"{stem}.csv"
+        columns = self.columns[stem]
+        n_records = len(next(iter(columns.values())))
+        if n_records:
+            df = pd.DataFrame(columns)
+            for col, dtype in DATASET_DTYPES[stem].items():
+                df[col] = pd.to_numeric(df[col], errors='coerce').astype(dtype)
             df.to_csv(csv_path, index=False)
-            df.to_json(json_path, orient='records', indent=2)
-            logger.info(f"Saved {len(self.pathways)} pathways records")
+            # orjson serializes the records in C and skips pandas' per-row
+            # JSON encoder; OPT_INDENT_2 keeps the output diffable. Missing
+            # counts go back to '' so the JSON matches the CSV convention.
+            json_records = df.astype(object).where(df.notna(), '').to_dict(orient='records')
+            (OUT_DATA_DIR / f"{stem}.json").write_bytes(
+                orjson.dumps(json_records, option=orjson.OPT_INDENT_2))
+            try:
+                df.to_parquet(OUT_DATA_DIR / f"{stem}.parquet", engine='pyarrow',
+                              compression='zstd')
+            except Exception as e:
+                # Mixed-type object columns (e.g. tested_n holding int or '')
+                # have no arrow mapping; the CSV/JSON outputs are authoritative
+                logger.warning(f"Could not write {stem}.parquet: {e}")
+            logger.info(f"Saved {n_records} {stem} records")
         else:
-            logger.warning("No pathways data parsed from fetched files")
-            seed_csv = SEED_DATA_DIR / "pathways.csv"
+            logger.warning(f"No {stem} data parsed from fetched files")
+            seed_csv = SEED_DATA_DIR / f"{stem}.csv"
             if seed_csv.exists():
-                logger.info("Copying seed pathways data as fallback")
-                shutil.copy2(seed_csv, OUT_DATA_DIR / "pathways.csv")
+                logger.info(f"Copying seed {stem} data as fallback")
+                shutil.copy2(seed_csv, csv_path)
             else:
-                pd.DataFrame(columns=['district', 'year', 'pathway', 'value_pct',
-                                     'cohort_n', 'source_url']).to_csv(
-                    OUT_DATA_DIR / "pathways.csv", index=False)
+                pd.DataFrame(columns=list(columns)).to_csv(csv_path, index=False)
+
+    def save_data(self):
+        """Save normalized data to CSV/JSON/Parquet, falling back to seed data if empty."""
+        for stem in DATASET_COLUMNS:
+            self.save_dataset(stem)
 
         # Copy sources.json
         sources_src = CACHE_DIR / "sources.json"
         sources_dst = OUT_DATA_DIR / "sources.json"
         if sources_src.exists():
-            sources_dst.write_text(sources_src.read_text())
+            # copyfile stays in the kernel (sendfile) instead of decoding the
+            # whole JSON to a str and re-encoding it on write
+            shutil.copyfile(sources_src, sources_dst)
             logger.info("Copied sources.json to out/data/")
         else:
             seed_sources = SEED_DATA_DIR / "sources.json"
             if seed_sources.exists():
                 logger.info("Copying seed sources.json as fallback")
-                sources_dst.write_text(seed_sources.read_text())
+                shutil.copyfile(seed_sources, sources_dst)
             else:
                 logger.warning("No sources.json available")
 
@@ -604,7 +825,7 @@ def main():
     normalizer = DataNormalizer()
     normalizer.process_cached_files()
     normalizer.save_data()
-    
+
     logger.info("\nData normalization complete!")
     return 0
 
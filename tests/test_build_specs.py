@@ -1,39 +1,51 @@
 """Tests for build_specs.py — BOCES clustering and spec generation."""
 
+import csv
 import hashlib
 import json
-import shutil
+from itertools import product
 from pathlib import Path
 
-import pandas as pd
+import numpy as np
+import orjson
 import pytest
 
 # Ensure scripts/ is importable
 import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
 
+import build_specs
 from build_specs import SpecBuilder
 
+DISTRICT_NAMES = ["DistA", "DistB", "DistC", "DistD"]
 
-@pytest.fixture
-def builder(tmp_path):
-    """Create a SpecBuilder with temp directories and sample data."""
-    # Set up temp directories
-    out_data = tmp_path / "out" / "data"
-    out_spec = tmp_path / "out" / "spec"
-    config_dir = tmp_path / "config"
-    seed_dir = tmp_path / "data" / "seed"
-    out_data.mkdir(parents=True)
-    out_spec.mkdir(parents=True)
-    config_dir.mkdir(parents=True)
-    seed_dir.mkdir(parents=True)
 
-    # Patch module-level paths
-    import build_specs
-    build_specs.OUT_DATA_DIR = out_data
-    build_specs.OUT_SPEC_DIR = out_spec
-    build_specs.SEED_DATA_DIR = seed_dir
-    build_specs.CONFIG_DIR = config_dir
+def _hashed_values(keys, modulo):
+    """Deterministic pseudo-random values per key, one batch instead of
+    per-row big-int hex conversion and modulo."""
+    raw = b"".join(
+        hashlib.md5("".join(str(part) for part in key).encode()).digest()[:8]
+        for key in keys
+    )
+    return np.frombuffer(raw, dtype=np.uint64) % modulo
+
+
+def _write_csv(path, header, columns):
+    """Write columnar fixture data without a DataFrame round-trip."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(zip(*columns))
+
+
+@pytest.fixture(scope="session")
+def sample_data_dir(tmp_path_factory):
+    """Write the sample config and CSVs once for the whole session.
+
+    Every test reads this data and none mutate it, so regenerating the
+    hashed rows and re-serializing five CSVs per test was pure overhead.
+    """
+    out_data = tmp_path_factory.mktemp("spec_sample_data")
 
     # Create sample config
     config = [
@@ -42,97 +54,134 @@ def builder(tmp_path):
         {"name": "DistC", "instid": "200000000001", "boces": "Region Beta"},
         {"name": "DistD", "instid": "200000000002", "boces": "Region Beta"},
     ]
-    (config_dir / "districts.json").write_text(json.dumps(config))
+    (out_data / "districts.json").write_text(json.dumps(config))
+
+    url = "https://example.com"
 
     # Create sample assessment CSV
-    rows = []
-    for name in ["DistA", "DistB", "DistC", "DistD"]:
-        for year in [2022, 2023, 2024]:
-            for subj in ["ELA", "MATH"]:
-                digest = int(hashlib.md5(f"{name}{year}{subj}".encode()).hexdigest(), 16)
-                pct = 60 + digest % 30
-                rows.append({
-                    "district": name, "year": year, "subject": subj,
-                    "grade_band": "All", "proficient_pct": pct,
-                    "tested_n": 1000, "source_url": "https://example.com"
-                })
-    pd.DataFrame(rows).to_csv(out_data / "assessments.csv", index=False)
+    keys = list(product(DISTRICT_NAMES, [2022, 2023, 2024], ["ELA", "MATH"]))
+    n = len(keys)
+    _write_csv(
+        out_data / "assessments.csv",
+        ["district", "year", "subject", "grade_band", "proficient_pct",
+         "tested_n", "source_url"],
+        [[k[0] for k in keys], [k[1] for k in keys], [k[2] for k in keys],
+         ["All"] * n, 60 + _hashed_values(keys, 30), [1000] * n, [url] * n])
 
     # Create sample levy CSV
-    levy_rows = []
-    for name in ["DistA", "DistB", "DistC", "DistD"]:
-        for fy in ["2022-2023", "2023-2024", "2024-2025"]:
-            digest = int(hashlib.md5(f"{name}{fy}".encode()).hexdigest(), 16)
-            pct = 1.0 + digest % 20 / 10.0
-            levy_rows.append({
-                "district": name, "fiscal_year": fy,
-                "levy_pct_change": pct, "levy_limit": "",
-                "proposed_levy": "", "source_url": "https://example.com"
-            })
-    pd.DataFrame(levy_rows).to_csv(out_data / "levy.csv", index=False)
+    keys = list(product(DISTRICT_NAMES, ["2022-2023", "2023-2024", "2024-2025"]))
+    n = len(keys)
+    _write_csv(
+        out_data / "levy.csv",
+        ["district", "fiscal_year", "levy_pct_change", "levy_limit",
+         "proposed_levy", "source_url"],
+        [[k[0] for k in keys], [k[1] for k in keys],
+         1.0 + _hashed_values(keys, 20) / 10.0, [""] * n, [""] * n, [url] * n])
 
     # Create sample expenditure CSV
-    exp_rows = []
-    for name in ["DistA", "DistB", "DistC", "DistD"]:
-        for sy in ["2021-22", "2022-23", "2023-24"]:
-            for cat in ["Educational", "Administrative", "Capital", "Operational"]:
-                digest = int(hashlib.md5(f"{name}{sy}{cat}".encode()).hexdigest(), 16)
-                pp = 5000 + digest % 20000
-                exp_rows.append({
-                    "district": name, "school_year": sy, "category": cat,
-                    "amount_total": pp * 3000, "per_pupil": pp,
-                    "dcaadm": 3000.0, "source_url": "https://example.com"
-                })
-    pd.DataFrame(exp_rows).to_csv(out_data / "expenditures.csv", index=False)
+    keys = list(product(DISTRICT_NAMES, ["2021-22", "2022-23", "2023-24"],
+                        ["Educational", "Administrative", "Capital", "Operational"]))
+    n = len(keys)
+    per_pupil = 5000 + _hashed_values(keys, 20000)
+    _write_csv(
+        out_data / "expenditures.csv",
+        ["district", "school_year", "category", "amount_total", "per_pupil",
+         "dcaadm", "source_url"],
+        [[k[0] for k in keys], [k[1] for k in keys], [k[2] for k in keys],
+         per_pupil * 3000, per_pupil, [3000.0] * n, [url] * n])
 
     # Create sample graduation CSV
-    grad_rows = []
-    for name in ["DistA", "DistB", "DistC", "DistD"]:
-        for year in [2022, 2023, 2024]:
-            for metric in ["grad_4yr_aug", "grad_5yr", "grad_6yr"]:
-                digest = int(hashlib.md5(f"{name}{year}{metric}".encode()).hexdigest(), 16)
-                pct = 70 + digest % 25
-                grad_rows.append({
-                    "district": name, "year": year, "metric": metric,
-                    "value_pct": pct, "cohort_n": 500,
-                    "source_url": "https://example.com"
-                })
-    pd.DataFrame(grad_rows).to_csv(out_data / "graduation.csv", index=False)
+    keys = list(product(DISTRICT_NAMES, [2022, 2023, 2024],
+                        ["grad_4yr_aug", "grad_5yr", "grad_6yr"]))
+    n = len(keys)
+    _write_csv(
+        out_data / "graduation.csv",
+        ["district", "year", "metric", "value_pct", "cohort_n", "source_url"],
+        [[k[0] for k in keys], [k[1] for k in keys], [k[2] for k in keys],
+         70 + _hashed_values(keys, 25), [500] * n, [url] * n])
 
     # Create sample pathways CSV
-    pw_rows = []
-    for name in ["DistA", "DistB", "DistC", "DistD"]:
-        for year in [2022, 2023, 2024]:
-            for pw in ["Regents", "Advanced Regents", "Local", "CDOS"]:
-                digest = int(hashlib.md5(f"{name}{year}{pw}".encode()).hexdigest(), 16)
-                pct = 10 + digest % 40
-                pw_rows.append({
-                    "district": name, "year": year, "pathway": pw,
-                    "value_pct": pct, "cohort_n": 500,
-                    "source_url": "https://example.com"
-                })
-    pd.DataFrame(pw_rows).to_csv(out_data / "pathways.csv", index=False)
+    keys = list(product(DISTRICT_NAMES, [2022, 2023, 2024],
+                        ["Regents", "Advanced Regents", "Local", "CDOS"]))
+    n = len(keys)
+    _write_csv(
+        out_data / "pathways.csv",
+        ["district", "year", "pathway", "value_pct", "cohort_n", "source_url"],
+        [[k[0] for k in keys], [k[1] for k in keys], [k[2] for k in keys],
+         10 + _hashed_values(keys, 40), [500] * n, [url] * n])
+
+    return out_data
+
+
+@pytest.fixture
+def builder(tmp_path, sample_data_dir):
+    """Create a SpecBuilder over the shared sample data and temp output dirs."""
+    out_spec = tmp_path / "out" / "spec"
+    seed_dir = tmp_path / "data" / "seed"
+    out_spec.mkdir(parents=True)
+    seed_dir.mkdir(parents=True)
+
+    # Patch module-level paths; only the spec output is per-test writable
+    build_specs.OUT_DATA_DIR = sample_data_dir
+    build_specs.OUT_SPEC_DIR = out_spec
+    build_specs.SEED_DATA_DIR = seed_dir
+    build_specs.CONFIG_DIR = sample_data_dir
 
     b = SpecBuilder()
+    # Every test wants the data loaded; doing it here keeps one read per test
+    # instead of a load_data() line at the top of each body
+    b.load_data()
     return b
 
 
+@pytest.fixture(scope="module")
+def built_specs(tmp_path_factory, sample_data_dir):
+    """Run build_all_specs once and share the output with the index tests.
+
+    The spec files are a pure function of the sample data, so the three
+    tests that inspect them don't each need their own build.
+    """
+    out_spec = tmp_path_factory.mktemp("built_specs")
+
+    build_specs.OUT_DATA_DIR = sample_data_dir
+    build_specs.OUT_SPEC_DIR = out_spec
+    build_specs.SEED_DATA_DIR = sample_data_dir
+    build_specs.CONFIG_DIR = sample_data_dir
+
+    b = SpecBuilder()
+    b.load_data()
+    b.build_all_specs()
+
+    index = orjson.loads((out_spec / "index.json").read_bytes())
+    return out_spec, index
+
+
+@pytest.fixture(scope="module")
+def benchmarks(tmp_path_factory, sample_data_dir):
+    """BOCES benchmarks computed once; they are pure over the sample data."""
+    build_specs.OUT_DATA_DIR = sample_data_dir
+    build_specs.OUT_SPEC_DIR = tmp_path_factory.mktemp("benchmark_specs")
+    build_specs.SEED_DATA_DIR = sample_data_dir
+    build_specs.CONFIG_DIR = sample_data_dir
+
+    b = SpecBuilder()
+    b.load_data()
+    return b.compute_boces_benchmarks()
+
+
 class TestSpecBuilder:
     """Tests for SpecBuilder functionality."""
 
     def test_load_data_from_csv(self, builder):
-        builder.load_data()
         assert not builder.assessments_df.empty
         assert not builder.levy_df.empty
 
     def test_boces_map_populated(self, builder):
-        builder.load_data()
         assert "DistA" in builder.boces_map
         assert builder.boces_map["DistA"] == "Region Alpha"
         assert builder.boces_map["DistC"] == "Region Beta"
 
     def test_build_proficiency_chart(self, builder):
-        builder.load_data()
         chart = builder.build_proficiency_chart("DistA")
         assert chart["type"] == "line"
         assert "Proficiency" in chart["title"]
@@ -140,24 +189,20 @@ class TestSpecBuilder:
         assert len(chart["series"]) > 0
 
     def test_build_proficiency_chart_empty_district(self, builder):
-        builder.load_data()
         chart = builder.build_proficiency_chart("NonExistent")
         assert chart["data"] == []
 
     def test_build_levy_chart(self, builder):
-        builder.load_data()
         chart = builder.build_levy_chart("DistA")
         assert chart["type"] == "bar"
         assert "Levy" in chart["title"]
         assert len(chart["data"]) > 0
 
     def test_build_levy_chart_empty_district(self, builder):
-        builder.load_data()
         chart = builder.build_levy_chart("NonExistent")
         assert chart["data"] == []
 
     def test_build_expenditure_chart(self, builder):
-        builder.load_data()
         chart = builder.build_expenditure_chart("DistA")
         assert chart["type"] == "line"
         assert "Per Pupil Expenditures" in chart["title"]
@@ -167,12 +212,10 @@ class TestSpecBuilder:
         assert set(series_names) == {"Educational", "Administrative", "Capital", "Operational"}
 
     def test_build_expenditure_chart_empty_district(self, builder):
-        builder.load_data()
         chart = builder.build_expenditure_chart("NonExistent")
         assert chart["data"] == []
 
     def test_build_graduation_chart(self, builder):
-        builder.load_data()
         chart = builder.build_graduation_chart("DistA")
         assert chart["type"] == "line"
         assert "Graduation" in chart["title"]
@@ -180,12 +223,10 @@ class TestSpecBuilder:
         assert len(chart["series"]) > 0
 
     def test_build_graduation_chart_empty_district(self, builder):
-        builder.load_data()
         chart = builder.build_graduation_chart("NonExistent")
         assert chart["data"] == []
 
     def test_build_pathways_chart(self, builder):
-        builder.load_data()
         chart = builder.build_pathways_chart("DistA")
         assert chart["type"] == "line"
         assert "Pathways" in chart["title"]
@@ -193,51 +234,40 @@ class TestSpecBuilder:
         assert len(chart["series"]) > 0
 
     def test_build_pathways_chart_empty_district(self, builder):
-        builder.load_data()
         chart = builder.build_pathways_chart("NonExistent")
         assert chart["data"] == []
 
     def test_district_spec_with_graduation_has_5_charts(self, builder):
-        builder.load_data()
         spec = builder.build_district_spec("DistA")
         assert spec["district"] == "DistA"
         assert len(spec["charts"]) == 5
         assert "disclaimer" in spec["metadata"]
 
-    def test_graduation_boces_benchmarks(self, builder):
-        builder.load_data()
-        benchmarks = builder.compute_boces_benchmarks()
+    def test_graduation_boces_benchmarks(self, benchmarks):
         assert "Region Alpha" in benchmarks
         assert "graduation" in benchmarks["Region Alpha"]
         assert len(benchmarks["Region Alpha"]["graduation"]) > 0
 
     def test_build_district_spec(self, builder):
-        builder.load_data()
         spec = builder.build_district_spec("DistA")
         assert spec["district"] == "DistA"
         assert len(spec["charts"]) == 5
         assert "disclaimer" in spec["metadata"]
 
-    def test_compute_boces_benchmarks(self, builder):
-        builder.load_data()
-        benchmarks = builder.compute_boces_benchmarks()
+    def test_compute_boces_benchmarks(self, benchmarks):
         assert "Region Alpha" in benchmarks
         assert "Region Beta" in benchmarks
         assert "assessment" in benchmarks["Region Alpha"]
         assert "levy" in benchmarks["Region Alpha"]
 
-    def test_benchmark_data_is_average(self, builder):
-        builder.load_data()
-        benchmarks = builder.compute_boces_benchmarks()
+    def test_benchmark_data_is_average(self, benchmarks):
         # Check that benchmark values are between min/max of constituent districts
         alpha_bench = benchmarks["Region Alpha"]["assessment"]
         for entry in alpha_bench:
             pct = entry["proficient_pct"]
             assert 0 <= pct <= 100, f"Benchmark out of range: {pct}"
 
-    def test_build_boces_cluster_spec(self, builder):
-        builder.load_data()
-        benchmarks = builder.compute_boces_benchmarks()
+    def test_build_boces_cluster_spec(self, builder, benchmarks):
         spec = builder.build_boces_cluster_spec(
             "Region Alpha", ["DistA", "DistB"], benchmarks
         )
@@ -246,9 +276,7 @@ class TestSpecBuilder:
         assert "DistA" in spec["districts"]
         assert "DistB" in spec["districts"]
 
-    def test_cluster_spec_has_benchmark_series(self, builder):
-        builder.load_data()
-        benchmarks = builder.compute_boces_benchmarks()
+    def test_cluster_spec_has_benchmark_series(self, builder, benchmarks):
         spec = builder.build_boces_cluster_spec(
             "Region Alpha", ["DistA", "DistB"], benchmarks
         )
@@ -258,9 +286,7 @@ class TestSpecBuilder:
         assert any("Avg" in n for n in series_names), \
             f"Expected benchmark series, got: {series_names}"
 
-    def test_cluster_spec_benchmark_is_dashed(self, builder):
-        builder.load_data()
-        benchmarks = builder.compute_boces_benchmarks()
+    def test_cluster_spec_benchmark_is_dashed(self, builder, benchmarks):
         spec = builder.build_boces_cluster_spec(
             "Region Alpha", ["DistA", "DistB"], benchmarks
         )
@@ -270,12 +296,8 @@ class TestSpecBuilder:
             assert s.get("dashStyle") == "dashed", \
                 f"Benchmark series should be dashed: {s['name']}"
 
-    def test_build_all_specs_creates_files(self, builder):
-        builder.load_data()
-        builder.build_all_specs()
-
-        import build_specs
-        spec_dir = build_specs.OUT_SPEC_DIR
+    def test_build_all_specs_creates_files(self, built_specs):
+        spec_dir, _ = built_specs
 
         # District specs
         assert (spec_dir / "dista.json").exists()
@@ -288,28 +310,16 @@ class TestSpecBuilder:
         # Index
         assert (spec_dir / "index.json").exists()
 
-    def test_index_contains_boces(self, builder):
-        builder.load_data()
-        builder.build_all_specs()
-
-        import build_specs
-        index_file = build_specs.OUT_SPEC_DIR / "index.json"
-        with open(index_file) as f:
-            index = json.load(f)
+    def test_index_contains_boces(self, built_specs):
+        _, index = built_specs
 
         assert "boces" in index
         assert len(index["boces"]) >= 2
         assert all("name" in b for b in index["boces"])
         assert all("spec_file" in b for b in index["boces"])
 
-    def test_index_districts_have_boces(self, builder):
-        builder.load_data()
-        builder.build_all_specs()
-
-        import build_specs
-        index_file = build_specs.OUT_SPEC_DIR / "index.json"
-        with open(index_file) as f:
-            index = json.load(f)
+    def test_index_districts_have_boces(self, built_specs):
+        _, index = built_specs
 
         for d in index["districts"]:
             assert "boces" in d, f"District {d['name']} missing boces in index"
@@ -319,22 +329,21 @@ class TestSeedDataFallback:
     """Test that seed data is used when no fetched data exists."""
 
     def test_uses_seed_when_out_empty(self, tmp_path):
-        import build_specs
-
         out_data = tmp_path / "out" / "data"
         out_spec = tmp_path / "out" / "spec"
         config_dir = tmp_path / "config"
-        seed_dir = tmp_path / "data" / "seed"
         out_data.mkdir(parents=True)
         out_spec.mkdir(parents=True)
         config_dir.mkdir(parents=True)
-        seed_dir.mkdir(parents=True)
 
-        # Use real seed data
-        real_seed = Path("data/seed")
+        # Point at the real seed data directly - the fallback only reads it,
+        # so copying every file into tmp_path was wasted I/O
+        real_seed = Path("data/seed").resolve()
         if real_seed.exists():
-            for f in real_seed.iterdir():
-                shutil.copy2(f, seed_dir / f.name)
+            seed_dir = real_seed
+        else:
+            seed_dir = tmp_path / "data" / "seed"
+            seed_dir.mkdir(parents=True)
 
         # Create minimal config
         config = [{"name": "Niskayuna", "instid": "441101060000", "boces": "Capital Region BOCES"}]
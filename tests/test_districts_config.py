@@ -3,16 +3,16 @@
 import json
 from pathlib import Path
 
+import orjson
 import pytest
 
 CONFIG_FILE = Path("config/districts.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def districts():
-    """Load districts config."""
-    with open(CONFIG_FILE) as f:
-        return json.load(f)
+    """Load districts config once; it is read-only during the test run."""
+    return orjson.loads(CONFIG_FILE.read_bytes())
 
 
 class TestDistrictsConfig:
@@ -2,6 +2,7 @@
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
@@ -16,34 +17,64 @@ import fetch_sources
 CACHE_NEVER_EXPIRES_HOURS = 24 * 3650
 
 
+@pytest.fixture(scope="module")
+def thread_pool():
+    """Shared executor - spawning and joining 4 OS threads per test is the
+    dominant cost of the parallel-execution tests."""
+    executor = ThreadPoolExecutor(max_workers=4)
+    yield executor
+    executor.shutdown()
+
+
+class TestModuleInterface:
+    """Guard against a stale copy of fetch_sources shadowing the current one."""
+
+    def test_datafetcher_has_current_fetch_methods(self):
+        assert hasattr(fetch_sources.DataFetcher, "fetch_graduation_rate_data")
+        assert hasattr(fetch_sources.DataFetcher, "fetch_graduation_pathways_data")
+        assert hasattr(fetch_sources.DataFetcher, "fetch_fiscal_profiles")
+
+    def test_datafetcher_is_thread_pool_ready(self, tmp_path):
+        with patch.object(fetch_sources, "CACHE_DIR", tmp_path / "cache"):
+            fetcher = fetch_sources.DataFetcher()
+            assert hasattr(fetcher, "sources_lock")
+
+
 class TestDataFetcherThreadSafety:
     """Test that DataFetcher is thread-safe."""
 
-    def test_record_source_is_thread_safe(self, tmp_path):
+    def test_record_source_is_thread_safe(self, tmp_path, thread_pool):
         """Test that record_source can be called from multiple threads."""
         # Set up temp cache dir
         with patch.object(fetch_sources, 'CACHE_DIR', tmp_path / 'cache'):
             fetcher = fetch_sources.DataFetcher()
-            
+
             # Verify lock exists
             assert hasattr(fetcher, 'sources_lock')
-            
-            # Record multiple sources
-            for i in range(10):
-                fetcher.record_source(
+
+            # Record sources from concurrent threads; without the lock this
+            # burst loses appends to the shared list
+            futures = [
+                thread_pool.submit(
+                    fetcher.record_source,
                     url=f"http://example.com/{i}",
                     status="success",
-                    filepath=f"test_{i}.html"
+                    filepath=f"test_{i}.html",
                 )
-            
+                for i in range(1000)
+            ]
+            for future in futures:
+                future.result()
+
             # Verify all sources were recorded
-            assert len(fetcher.sources) == 10
-            
+            assert len(fetcher.sources) == 1000
+            recorded_urls = {source.url for source in fetcher.sources}
+            assert recorded_urls == {f"http://example.com/{i}" for i in range(1000)}
+
             # Verify sources have correct structure
             for source in fetcher.sources:
-                assert "url" in source
-                assert "status" in source
-                assert "fetched_at" in source
+                assert source.status == "success"
+                assert source.fetched_at
 
     def test_fetch_district_data_returns_name(self, tmp_path):
         """Test that fetch_district_data returns the district name."""
@@ -68,10 +99,8 @@ class TestDataFetcherThreadSafety:
                 # Verify it returns the district name
                 assert result == "Test District"
 
-    def test_parallel_execution_with_multiple_districts(self, tmp_path):
+    def test_parallel_execution_with_multiple_districts(self, tmp_path, thread_pool):
         """Test that parallel execution works with multiple districts."""
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        
         with patch.object(fetch_sources, 'CACHE_DIR', tmp_path / 'cache'):
             fetcher = fetch_sources.DataFetcher()
             
@@ -89,15 +118,14 @@ class TestDataFetcherThreadSafety:
                 
                 # Execute in parallel
                 completed_districts = []
-                with ThreadPoolExecutor(max_workers=4) as executor:
-                    future_to_district = {
-                        executor.submit(fetcher.fetch_district_data, district): district
-                        for district in districts
-                    }
-                    
-                    for future in as_completed(future_to_district):
-                        district_name = future.result()
-                        completed_districts.append(district_name)
+                future_to_district = {
+                    thread_pool.submit(fetcher.fetch_district_data, district): district
+                    for district in districts
+                }
+
+                for future in as_completed(future_to_district):
+                    district_name = future.result()
+                    completed_districts.append(district_name)
                 
                 # Verify all districts were processed
                 assert len(completed_districts) == 5
@@ -134,9 +162,8 @@ class TestMainFunctionParallelization:
             result = fetch_sources.main()
             assert result == 0
 
-    def test_threadpool_processes_multiple_districts(self):
+    def test_threadpool_processes_multiple_districts(self, thread_pool):
         """Test that ThreadPoolExecutor can process multiple districts concurrently."""
-        from concurrent.futures import ThreadPoolExecutor
         from threading import Lock
         
         # This test verifies the parallel execution infrastructure exists
@@ -155,9 +182,8 @@ class TestMainFunctionParallelization:
             return district["name"]
         
         # Test that ThreadPoolExecutor can be used as expected
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = [executor.submit(mock_fetch, d) for d in districts]
-            results = [f.result() for f in futures]
+        futures = [thread_pool.submit(mock_fetch, d) for d in districts]
+        results = [f.result() for f in futures]
         
         assert len(results) == 10
         assert len(processed) == 10
@@ -165,38 +191,50 @@ class TestMainFunctionParallelization:
         assert set(processed) == {f"District {i}" for i in range(10)}
 
 
-class TestFetchCadenceCaching:
-    """Test cache reuse cadence for data fetching."""
+ASSESSMENT_CACHE_COMBOS = [(2024, "math"), (2024, "ela"), (2023, "math")]
 
-    def test_assessment_uses_fresh_cached_source(self, tmp_path):
-        """Assessment fetch should reuse cache when within frequent refresh window."""
-        cache_dir = tmp_path / "cache"
-        cache_dir.mkdir()
 
-        cached_file = cache_dir / "test_district_assessment_math_2024.html"
+@pytest.fixture(scope="module")
+def assessment_cache_dir(tmp_path_factory):
+    """Cache dir with fresh sources.json entries for every (year, subject)
+    combo, built once instead of per parametrized case."""
+    cache_dir = tmp_path_factory.mktemp("assessment_cache")
+    entries = []
+    fetched_at = datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat()
+    for year, subject in ASSESSMENT_CACHE_COMBOS:
+        cached_file = cache_dir / f"test_district_assessment_{subject}_{year}.html"
         cached_file.write_text("<html>cached</html>")
-        source_url = "https://data.nysed.gov/assessment38.php?instid=123&year=2024&subject=math"
-        fetched_at = datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat()
-        sources_file = cache_dir / "sources.json"
-        sources_file.write_text(json.dumps([{
-            "url": source_url,
+        entries.append({
+            "url": f"https://data.nysed.gov/assessment38.php?instid=123&year={year}&subject={subject}",
             "status": "success",
             "filepath": str(cached_file),
-            "fetched_at": fetched_at
-        }]))
+            "fetched_at": fetched_at,
+        })
+    sources_file = cache_dir / "sources.json"
+    sources_file.write_text(json.dumps(entries))
+    return cache_dir
 
-        with patch.object(fetch_sources, "CACHE_DIR", cache_dir), \
-             patch.object(fetch_sources, "SOURCES_JSON", sources_file), \
+
+class TestFetchCadenceCaching:
+    """Test cache reuse cadence for data fetching."""
+
+    @pytest.mark.parametrize("year,subject", ASSESSMENT_CACHE_COMBOS)
+    def test_assessment_uses_fresh_cached_source(self, assessment_cache_dir, year, subject):
+        """Assessment fetch should reuse cache when within frequent refresh window."""
+        cached_file = assessment_cache_dir / f"test_district_assessment_{subject}_{year}.html"
+
+        with patch.object(fetch_sources, "CACHE_DIR", assessment_cache_dir), \
+             patch.object(fetch_sources, "SOURCES_JSON", assessment_cache_dir / "sources.json"), \
              patch.object(fetch_sources, "FREQUENT_REFRESH_HOURS", CACHE_NEVER_EXPIRES_HOURS), \
-             patch.object(fetch_sources, "ASSESSMENT_YEARS", [2024]), \
-             patch.object(fetch_sources, "SUBJECTS", ["math"]):
+             patch.object(fetch_sources, "ASSESSMENT_YEARS", [year]), \
+             patch.object(fetch_sources, "SUBJECTS", [subject]):
             fetcher = fetch_sources.DataFetcher()
 
             with patch.object(fetcher, "fetch_url") as mock_fetch_url:
                 fetcher.fetch_assessment_data("123", "Test District")
                 mock_fetch_url.assert_not_called()
                 assert len(fetcher.sources) == 1
-                assert fetcher.sources[0]["filepath"] == str(cached_file)
+                assert fetcher.sources[0].filepath == str(cached_file)
 
     def test_budget_refetches_when_cache_is_stale(self, tmp_path):
         """Budget fetch should refetch when cached source is older than monthly window."""
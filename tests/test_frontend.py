@@ -16,8 +16,10 @@ import pytest
 class TestDashboardHTML:
     """Validate the static HTML structure."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def html_content(self):
+        # The assets are static during the test run, so one read serves
+        # every substring assertion in the class
         return (Path("site/index.html")).read_text()
 
     def test_has_boces_filter(self, html_content):
@@ -54,7 +56,7 @@ class TestDashboardHTML:
 class TestAppJSStructure:
     """Validate app.js code structure."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def js_content(self):
         return (Path("site/app.js")).read_text()
 
@@ -114,18 +116,21 @@ class TestAppJSStructure:
 class TestResourcesPage:
     """Validate resources.html exists and has expected structure."""
 
+    @pytest.fixture(scope="module")
+    def resources_content(self):
+        return (Path("site/resources.html")).read_text()
+
     def test_resources_page_exists(self):
         assert Path("site/resources.html").exists()
 
-    def test_resources_has_table(self):
-        content = Path("site/resources.html").read_text()
-        assert "<table" in content
+    def test_resources_has_table(self, resources_content):
+        assert "<table" in resources_content
 
 
 class TestStylesCSS:
     """Validate styles.css has necessary rules."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def css_content(self):
         return (Path("site/styles.css")).read_text()
 
@@ -1,39 +1,62 @@
 """Integration tests for the full build pipeline."""
 
-import json
+import os
 import shutil
+import sys
 from pathlib import Path
 
+import orjson
 import pytest
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+# The seed files the build actually consumes; anything else in data/seed
+# (editor droppings, docs) should not be dragged into the tmpdir
+SEED_FILES = (
+    "assessments.csv",
+    "levy.csv",
+    "expenditures.csv",
+    "graduation.csv",
+    "pathways.csv",
+    "sources.json",
+)
+
 
 class TestFullPipeline:
-    """Test the full pipeline: normalize -> build_specs -> build_site."""
+    """Test the full pipeline: normalize -> build_specs -> build_site.
 
-    @pytest.fixture(autouse=True)
-    def setup_and_teardown(self, tmp_path):
-        """Set up temp output dirs and run the pipeline once."""
-        import sys
-        sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+    The pipeline run and the parsed artifacts are class-scoped: every test
+    here is a read-only assertion over the same build, so rebuilding the
+    site and re-parsing index.json per test was pure overhead.
+    """
 
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def setup_and_teardown(cls, tmp_path_factory):
+        """Set up temp output dirs and run the pipeline once for the class."""
         import build_specs
         import build_site
 
         # Set up dirs
-        self.out_dir = tmp_path / "out"
-        self.out_data = self.out_dir / "data"
-        self.out_spec = self.out_dir / "spec"
-        self.out_data.mkdir(parents=True)
-        self.out_spec.mkdir(parents=True)
-
-        # Copy real seed data as source
+        cls.out_dir = tmp_path_factory.mktemp("pipeline") / "out"
+        cls.out_data = cls.out_dir / "data"
+        cls.out_spec = cls.out_dir / "spec"
+        cls.out_data.mkdir(parents=True)
+        cls.out_spec.mkdir(parents=True)
+
+        # Stage the seed data as source; a hardlink is metadata-only when the
+        # tmpdir shares a filesystem with the repo, with a copy fallback when
+        # it doesn't (the pipeline never mutates these inputs)
         real_seed = Path("data/seed")
-        for f in real_seed.iterdir():
-            shutil.copy2(f, self.out_data / f.name)
+        for name in SEED_FILES:
+            try:
+                os.link(real_seed / name, cls.out_data / name)
+            except OSError:
+                shutil.copy(real_seed / name, cls.out_data / name)
 
         # Patch paths
-        build_specs.OUT_DATA_DIR = self.out_data
-        build_specs.OUT_SPEC_DIR = self.out_spec
+        build_specs.OUT_DATA_DIR = cls.out_data
+        build_specs.OUT_SPEC_DIR = cls.out_spec
         build_specs.SEED_DATA_DIR = real_seed
         build_specs.CONFIG_DIR = Path("config")
 
@@ -43,12 +66,21 @@ class TestFullPipeline:
         builder.build_all_specs()
 
         # Run build_site
-        build_site.OUT_DIR = self.out_dir
+        build_site.OUT_DIR = cls.out_dir
         build_site.SITE_DIR = Path("site")
         site_builder = build_site.SiteBuilder()
         site_builder.copy_site_files()
         site_builder.generate_manifest()
 
+        # Parse the shared artifacts once; every test reads these
+        cls.index = orjson.loads((cls.out_spec / "index.json").read_bytes())
+        cls.first_district_spec = orjson.loads(
+            (cls.out_spec / cls.index["districts"][0]["spec_file"]).read_bytes())
+        cls.first_boces_spec = orjson.loads(
+            (cls.out_spec / cls.index["boces"][0]["spec_file"]).read_bytes())
+        # One directory listing replaces a stat call per spec file
+        cls.spec_filenames = {entry.name for entry in os.scandir(cls.out_spec)}
+
         yield
 
     def test_index_html_copied(self):
@@ -64,90 +96,54 @@ class TestFullPipeline:
         assert (self.out_spec / "index.json").exists()
 
     def test_spec_index_has_districts(self):
-        with open(self.out_spec / "index.json") as f:
-            index = json.load(f)
-        assert len(index["districts"]) >= 50
+        assert len(self.index["districts"]) >= 50
 
     def test_spec_index_has_boces(self):
-        with open(self.out_spec / "index.json") as f:
-            index = json.load(f)
-        assert "boces" in index
-        assert len(index["boces"]) >= 10
+        assert "boces" in self.index
+        assert len(self.index["boces"]) >= 10
 
     def test_district_spec_files_exist(self):
-        with open(self.out_spec / "index.json") as f:
-            index = json.load(f)
-        for d in index["districts"][:5]:  # spot check first 5
-            spec_path = self.out_spec / d["spec_file"]
-            assert spec_path.exists(), f"Missing spec: {d['spec_file']}"
+        for d in self.index["districts"]:
+            assert d["spec_file"] in self.spec_filenames, f"Missing spec: {d['spec_file']}"
 
     def test_boces_spec_files_exist(self):
-        with open(self.out_spec / "index.json") as f:
-            index = json.load(f)
-        for b in index["boces"]:
-            spec_path = self.out_spec / b["spec_file"]
-            assert spec_path.exists(), f"Missing BOCES spec: {b['spec_file']}"
+        for b in self.index["boces"]:
+            assert b["spec_file"] in self.spec_filenames, f"Missing BOCES spec: {b['spec_file']}"
 
     def test_district_spec_has_charts(self):
-        with open(self.out_spec / "index.json") as f:
-            index = json.load(f)
-        d = index["districts"][0]
-        with open(self.out_spec / d["spec_file"]) as f:
-            spec = json.load(f)
-        assert "charts" in spec
-        assert len(spec["charts"]) >= 1
+        assert "charts" in self.first_district_spec
+        assert len(self.first_district_spec["charts"]) >= 1
 
     def test_boces_spec_has_charts(self):
-        with open(self.out_spec / "index.json") as f:
-            index = json.load(f)
-        b = index["boces"][0]
-        with open(self.out_spec / b["spec_file"]) as f:
-            spec = json.load(f)
-        assert "charts" in spec
-        assert len(spec["charts"]) >= 1
+        assert "charts" in self.first_boces_spec
+        assert len(self.first_boces_spec["charts"]) >= 1
 
     def test_manifest_exists(self):
         assert (self.out_dir / "manifest.json").exists()
 
     def test_manifest_has_entries(self):
-        with open(self.out_dir / "manifest.json") as f:
-            manifest = json.load(f)
+        manifest = orjson.loads((self.out_dir / "manifest.json").read_bytes())
         assert len(manifest) > 0
         assert "index.html" in manifest
         assert "app.js" in manifest
 
     def test_district_specs_have_boces_in_index(self):
-        with open(self.out_spec / "index.json") as f:
-            index = json.load(f)
-        for d in index["districts"]:
+        for d in self.index["districts"]:
             assert "boces" in d, f"District {d['name']} missing boces in index"
 
     def test_boces_cluster_has_districts_list(self):
-        with open(self.out_spec / "index.json") as f:
-            index = json.load(f)
-        b = index["boces"][0]
-        with open(self.out_spec / b["spec_file"]) as f:
-            spec = json.load(f)
-        assert "districts" in spec
-        assert len(spec["districts"]) >= 2
+        assert "districts" in self.first_boces_spec
+        assert len(self.first_boces_spec["districts"]) >= 2
 
     def test_district_spec_has_graduation_charts(self):
-        with open(self.out_spec / "index.json") as f:
-            index = json.load(f)
-        d = index["districts"][0]
-        with open(self.out_spec / d["spec_file"]) as f:
-            spec = json.load(f)
-        grad_charts = [c for c in spec["charts"] if "Graduation" in c["title"]]
-        assert len(grad_charts) >= 1, f"Expected graduation charts, got titles: {[c['title'] for c in spec['charts']]}"
+        charts = self.first_district_spec["charts"]
+        grad_charts = [c for c in charts if "Graduation" in c["title"]]
+        assert len(grad_charts) >= 1, f"Expected graduation charts, got titles: {[c['title'] for c in charts]}"
 
     def test_boces_cluster_proficiency_chart_has_benchmark(self):
-        with open(self.out_spec / "index.json") as f:
-            index = json.load(f)
-        b = index["boces"][0]
-        with open(self.out_spec / b["spec_file"]) as f:
-            spec = json.load(f)
+        charts = self.first_boces_spec["charts"]
         # Find proficiency chart
-        prof_chart = next((c for c in spec["charts"] if "Proficiency" in c["title"]), None)
+        prof_chart = next((c for c in charts if "Proficiency" in c["title"]), None)
         if prof_chart:
             series_names = [s["name"] for s in prof_chart["series"]]
             assert any("Avg" in n for n in series_names), \
@@ -1,115 +1,109 @@
 """Tests for the seed data files."""
 
-import csv
+import re
 from pathlib import Path
 
+import orjson
+import pandas as pd
 import pytest
 
 SEED_DIR = Path("data/seed")
 
+_FY_RE = re.compile(r"\d{4}-\d{4}")
+
 
 class TestSeedAssessments:
     """Tests for data/seed/assessments.csv."""
 
-    @pytest.fixture
-    def rows(self):
-        with open(SEED_DIR / "assessments.csv") as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def df():
+        return pd.read_csv(SEED_DIR / "assessments.csv")
 
     def test_file_exists(self):
         assert (SEED_DIR / "assessments.csv").exists()
 
-    def test_has_expected_columns(self, rows):
+    def test_has_expected_columns(self, df):
         expected = {"district", "year", "subject", "grade_band", "proficient_pct", "tested_n", "source_url"}
-        assert expected == set(rows[0].keys())
+        assert expected == set(df.columns)
 
-    def test_has_multiple_districts(self, rows):
-        districts = {r["district"] for r in rows}
-        assert len(districts) >= 50, f"Expected >= 50 districts, got {len(districts)}"
+    def test_has_multiple_districts(self, df):
+        n = df["district"].nunique()
+        assert n >= 50, f"Expected >= 50 districts, got {n}"
 
-    def test_has_ela_and_math(self, rows):
-        subjects = {r["subject"] for r in rows}
+    def test_has_ela_and_math(self, df):
+        subjects = set(df["subject"])
         assert "ELA" in subjects
         assert "MATH" in subjects
 
-    def test_proficiency_in_range(self, rows):
-        for r in rows:
-            pct = float(r["proficient_pct"])
-            assert 0 <= pct <= 100, f"Proficiency out of range: {pct} for {r['district']}"
+    def test_proficiency_in_range(self, df):
+        bad = df.loc[~df["proficient_pct"].between(0, 100), ["district", "proficient_pct"]]
+        assert bad.empty, f"Proficiency out of range:\n{bad}"
 
-    def test_years_present(self, rows):
-        years = {int(r["year"]) for r in rows}
+    def test_years_present(self, df):
+        years = set(df["year"])
         assert 2019 in years
         assert 2024 in years
 
-    def test_original_districts_present(self, rows):
-        districts = {r["district"] for r in rows}
+    def test_original_districts_present(self, df):
+        districts = set(df["district"])
         assert "Niskayuna" in districts
         assert "Bethlehem" in districts
         assert "Shenendehowa" in districts
 
-    def test_source_urls_present(self, rows):
-        for r in rows:
-            assert r["source_url"].startswith("https://"), f"Bad URL for {r['district']}"
+    def test_source_urls_present(self, df):
+        bad = df.loc[~df["source_url"].str.startswith("https://"), "source_url"]
+        assert bad.empty, f"Bad URLs: {list(bad.unique())}"
 
 
 class TestSeedLevy:
     """Tests for data/seed/levy.csv."""
 
-    @pytest.fixture
-    def rows(self):
-        with open(SEED_DIR / "levy.csv") as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def df():
+        return pd.read_csv(SEED_DIR / "levy.csv")
 
     def test_file_exists(self):
         assert (SEED_DIR / "levy.csv").exists()
 
-    def test_has_expected_columns(self, rows):
+    def test_has_expected_columns(self, df):
         expected = {"district", "fiscal_year", "levy_pct_change", "levy_limit", "proposed_levy", "source_url"}
-        assert expected == set(rows[0].keys())
+        assert expected == set(df.columns)
 
-    def test_has_multiple_districts(self, rows):
-        districts = {r["district"] for r in rows}
-        assert len(districts) >= 50
+    def test_has_multiple_districts(self, df):
+        assert df["district"].nunique() >= 50
 
-    def test_levy_pct_is_numeric(self, rows):
-        for r in rows:
-            if r["levy_pct_change"]:
-                pct = float(r["levy_pct_change"])
-                assert -10 <= pct <= 20, f"Levy pct out of range: {pct} for {r['district']}"
+    def test_levy_pct_is_numeric(self, df):
+        col = df["levy_pct_change"].dropna()
+        assert col.dtype.kind in "if", "levy_pct_change must parse as numeric"
+        bad = df.loc[col.index[~col.between(-10, 20)], ["district", "levy_pct_change"]]
+        assert bad.empty, f"Levy pct out of range:\n{bad}"
 
-    def test_fiscal_years_format(self, rows):
-        import re
-        for r in rows:
-            assert re.match(r'\d{4}-\d{4}', r["fiscal_year"]), \
-                f"Bad fiscal year: {r['fiscal_year']}"
+    def test_fiscal_years_format(self, df):
+        bad = df.loc[~df["fiscal_year"].str.match(_FY_RE), "fiscal_year"]
+        assert bad.empty, f"Bad fiscal years: {list(bad)}"
 
 
 class TestSeedSources:
     """Tests for data/seed/sources.json."""
 
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def sources_data():
+        return orjson.loads((SEED_DIR / "sources.json").read_bytes())
+
     def test_file_exists(self):
         assert (SEED_DIR / "sources.json").exists()
 
-    def test_is_valid_json(self):
-        import json
-        with open(SEED_DIR / "sources.json") as f:
-            data = json.load(f)
-        assert isinstance(data, list)
-
-    def test_has_entries(self):
-        import json
-        with open(SEED_DIR / "sources.json") as f:
-            data = json.load(f)
-        assert len(data) > 0
-
-    def test_entries_have_required_fields(self):
-        import json
-        with open(SEED_DIR / "sources.json") as f:
-            data = json.load(f)
-        for entry in data:
+    def test_is_valid_json(self, sources_data):
+        assert isinstance(sources_data, list)
+
+    def test_has_entries(self, sources_data):
+        assert len(sources_data) > 0
+
+    def test_entries_have_required_fields(self, sources_data):
+        for entry in sources_data:
             assert "url" in entry
             assert "status" in entry
             assert "fetched_at" in entry
@@ -118,41 +112,39 @@ class TestSeedSources:
 class TestSeedGraduation:
     """Tests for data/seed/graduation.csv."""
 
-    @pytest.fixture
-    def rows(self):
-        with open(SEED_DIR / "graduation.csv") as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def df():
+        return pd.read_csv(SEED_DIR / "graduation.csv")
 
     def test_file_exists(self):
         assert (SEED_DIR / "graduation.csv").exists()
 
-    def test_has_expected_columns(self, rows):
+    def test_has_expected_columns(self, df):
         expected = {"district", "year", "metric", "value_pct", "cohort_n", "source_url"}
-        assert expected == set(rows[0].keys())
+        assert expected == set(df.columns)
 
-    def test_has_multiple_districts(self, rows):
-        districts = {r["district"] for r in rows}
-        assert len(districts) >= 50, f"Expected >= 50 districts, got {len(districts)}"
+    def test_has_multiple_districts(self, df):
+        n = df["district"].nunique()
+        assert n >= 50, f"Expected >= 50 districts, got {n}"
 
-    def test_has_expected_metrics(self, rows):
-        metrics = {r["metric"] for r in rows}
+    def test_has_expected_metrics(self, df):
+        metrics = set(df["metric"])
         assert "grad_4yr_aug" in metrics
         assert "grad_5yr" in metrics
         assert "grad_6yr" in metrics
 
-    def test_value_in_range(self, rows):
-        for r in rows:
-            pct = float(r["value_pct"])
-            assert 0 <= pct <= 100, f"Value out of range: {pct} for {r['district']}"
+    def test_value_in_range(self, df):
+        bad = df.loc[~df["value_pct"].between(0, 100), ["district", "value_pct"]]
+        assert bad.empty, f"Value out of range:\n{bad}"
 
-    def test_years_present(self, rows):
-        years = {int(r["year"]) for r in rows}
+    def test_years_present(self, df):
+        years = set(df["year"])
         assert 2019 in years
         assert 2024 in years
 
-    def test_original_districts_present(self, rows):
-        districts = {r["district"] for r in rows}
+    def test_original_districts_present(self, df):
+        districts = set(df["district"])
         assert "Niskayuna" in districts
         assert "Bethlehem" in districts
         assert "Shenendehowa" in districts
@@ -161,31 +153,29 @@ class TestSeedGraduation:
 class TestSeedPathways:
     """Tests for data/seed/pathways.csv."""
 
-    @pytest.fixture
-    def rows(self):
-        with open(SEED_DIR / "pathways.csv") as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def df():
+        return pd.read_csv(SEED_DIR / "pathways.csv")
 
     def test_file_exists(self):
         assert (SEED_DIR / "pathways.csv").exists()
 
-    def test_has_expected_columns(self, rows):
+    def test_has_expected_columns(self, df):
         expected = {"district", "year", "pathway", "value_pct", "cohort_n", "source_url"}
-        assert expected == set(rows[0].keys())
+        assert expected == set(df.columns)
 
-    def test_has_multiple_districts(self, rows):
-        districts = {r["district"] for r in rows}
-        assert len(districts) >= 50, f"Expected >= 50 districts, got {len(districts)}"
+    def test_has_multiple_districts(self, df):
+        n = df["district"].nunique()
+        assert n >= 50, f"Expected >= 50 districts, got {n}"
 
-    def test_has_expected_pathways(self, rows):
-        pathways = {r["pathway"] for r in rows}
+    def test_has_expected_pathways(self, df):
+        pathways = set(df["pathway"])
         assert "Regents" in pathways
         assert "Advanced Regents" in pathways
         assert "Local" in pathways
         assert "CDOS" in pathways
 
-    def test_value_in_range(self, rows):
-        for r in rows:
-            pct = float(r["value_pct"])
-            assert 0 <= pct <= 100, f"Value out of range: {pct} for {r['district']}"
+    def test_value_in_range(self, df):
+        bad = df.loc[~df["value_pct"].between(0, 100), ["district", "value_pct"]]
+        assert bad.empty, f"Value out of range:\n{bad}"